@@ -10,14 +10,61 @@ earn rewards, and participate in governance. Features include:
 - Multi-tier reward rates
 """
 
-from typing import Dict, Tuple, Optional
+from array import array
+from typing import Dict, Final, List, NamedTuple, Tuple, Optional
+import hashlib
+import pickle
+import struct
 import time
 
+try:
+    # Optional JIT: when numba is installed the reward kernel compiles to
+    # cached native code (cache=True persists it across processes).
+    from numba import njit
+except ImportError:  # numba is optional; fall back to pure Python
+    # Underscore-prefixed so the ABI generator, which walks every
+    # FunctionDef in the module, does not surface the shim as a
+    # callable contract function
+    def _njit(*args, **kwargs):
+        def _wrap(func):
+            return func
+        return _wrap
+    njit = _njit
+
+
+@njit("int64(int64, int64, int64, int64)", cache=True, nogil=True)
+def _calc_reward_kernel(amount: int, apy: int, time_staked: int, denom: int) -> int:
+    """Pure integer reward math, kept free of dict lookups so it can be JIT-compiled."""
+    return (amount * apy * time_staked) // denom
+
+
+# Basis-point and time denominators, folded into one divisor so the reward
+# kernel pays a single integer division per call.
+SECONDS_PER_YEAR: Final = 365 * 24 * 3600
+BPS_DENOM: Final = 10_000
+_REWARD_DENOM: Final = BPS_DENOM * SECONDS_PER_YEAR
+
+
+# Staking pool tiers, indexed by a small int (0..3).  Four fixed tiers means
+# pool state can live in flat arrays instead of a dict keyed by lock days.
+_TIER_OF_LOCK_DAYS: Final = {30: 0, 90: 1, 180: 2, 365: 3}
+_POOL_LOCK_DAYS: Final = (30, 90, 180, 365)
+_POOL_APY: Final = (500, 800, 1200, 1800)  # 5%, 8%, 12%, 18% APY
+
+# Placeholder digest for absent Merkle siblings
+_EMPTY_HASH: Final = bytes(32)
+
+# Hot counters packed into one int64 array: in-place adds mutate the array
+# slot directly instead of rebinding a freshly allocated PyLong per update.
+_CTR_TOTAL_STAKED: Final = 0
+_CTR_TOTAL_REWARDS: Final = 1
+_CTR_NEXT_STAKE_ID: Final = 2
+
 
 class StakingContract:
     """
     Advanced Staking Contract for 0G Galileo Blockchain.
-    
+
     Features:
     - Flexible staking periods (30, 90, 180, 365 days)
     - Tiered reward rates based on lock duration
@@ -26,11 +73,35 @@ class StakingContract:
     - Compound staking rewards
     - Emergency pause functionality
     """
-    
+
+    __slots__ = (
+        "owner",
+        "reward_token",
+        "staking_token",
+        "paused",
+        "_counters",
+        "_pool_total_staked",
+        "_amount",
+        "_lock_days",
+        "_tier",
+        "_voting_multiplier",
+        "_start_time",
+        "_unlock_time",
+        "_last_reward_time",
+        "_accumulated_rewards",
+        "_active",
+        "_stake_owner",
+        "_stake_index",
+        "_interned_addresses",
+        "_tree_nodes",
+        "voting_power",
+        "emergency_withdrawal_penalty",
+    )
+
     def __init__(self, owner: str, reward_token: str, staking_token: str):
         """
         Initialize the staking contract.
-        
+
         Args:
             owner: Contract owner address
             reward_token: Address of reward token contract
@@ -39,339 +110,581 @@ class StakingContract:
         self.owner = owner
         self.reward_token = reward_token
         self.staking_token = staking_token
-        
+
         # Contract state
         self.paused = False
-        self.total_staked = 0
-        self.total_rewards_distributed = 0
-        
-        # Staking pools by duration (days)
-        self.staking_pools = {
-            30: {"apy": 500, "total_staked": 0},    # 5% APY
-            90: {"apy": 800, "total_staked": 0},    # 8% APY
-            180: {"apy": 1200, "total_staked": 0},  # 12% APY
-            365: {"apy": 1800, "total_staked": 0}   # 18% APY
-        }
-        
-        # User stakes: user -> [stake_id -> stake_info]
-        self.user_stakes: Dict[str, Dict[int, Dict]] = {}
-        
-        # Global stake counter
-        self.next_stake_id = 1
-        
+        self._counters = array("q", [0, 0, 1])  # total staked/rewards, next id
+
+        # Total staked per pool, indexed by tier (see _TIER_OF_LOCK_DAYS)
+        self._pool_total_staked = array("q", [0, 0, 0, 0])
+
+        # Stake storage, struct-of-arrays: one signed-64-bit column per
+        # field, indexed by row = stake_id - 1.  Contiguous columns keep
+        # aggregation loops on the C side instead of walking per-stake dicts.
+        self._amount = array("q")
+        self._lock_days = array("q")
+        self._tier = array("q")
+        self._voting_multiplier = array("q")
+        self._start_time = array("q")
+        self._unlock_time = array("q")
+        self._last_reward_time = array("q")
+        self._accumulated_rewards = array("q")
+        self._active = array("b")
+        self._stake_owner: List[str] = []
+
+        # Staker -> row indices of that staker's stakes
+        self._stake_index: Dict[str, List[int]] = {}
+
+        # Canonical address strings.  Interning each address on first
+        # sight makes later dict probes and _row_of owner checks compare
+        # by identity instead of re-hashing a 42-char string.
+        self._interned_addresses: Dict[str, str] = {}
+
+        # Incremental Merkle tree over stake rows: (level, index) -> digest.
+        # Each mutation rehashes only the touched leaf's path to the root,
+        # O(log N) hashes instead of rebuilding the whole tree.
+        self._tree_nodes: Dict[Tuple[int, int], bytes] = {}
+
         # Governance: user -> voting_power
         self.voting_power: Dict[str, int] = {}
-        
+
         # Emergency settings
         self.emergency_withdrawal_penalty = 2000  # 20%
-        
+
+    def _intern(self, address: str) -> str:
+        """Return the canonical instance of ``address`` seen by this contract."""
+        return self._interned_addresses.setdefault(address, address)
+
+    def _stake_leaf(self, row: int) -> bytes:
+        """Hash one stake row into a Merkle leaf."""
+        packed = struct.pack(
+            "<qqqqqqb",
+            self._amount[row],
+            self._lock_days[row],
+            self._start_time[row],
+            self._unlock_time[row],
+            self._last_reward_time[row],
+            self._accumulated_rewards[row],
+            self._active[row],
+        )
+        return hashlib.sha256(packed).digest()
+
+    def _tree_levels(self) -> int:
+        """Number of levels above the leaves for the current stake count."""
+        return max(1, (len(self._amount) - 1).bit_length())
+
+    def _update_leaf(self, row: int) -> None:
+        """Recompute the Merkle path from ``row``'s leaf up to the root."""
+        nodes = self._tree_nodes
+        node = self._stake_leaf(row)
+        nodes[(0, row)] = node
+
+        index = row
+        for level in range(self._tree_levels()):
+            sibling = nodes.get((level, index ^ 1), _EMPTY_HASH)
+            if index & 1:
+                node = hashlib.sha256(sibling + node).digest()
+            else:
+                node = hashlib.sha256(node + sibling).digest()
+            index >>= 1
+            nodes[(level + 1, index)] = node
+
+    def state_root(self) -> str:
+        """Merkle root committing to all stake rows, as a hex string."""
+        if not self._amount:
+            return _EMPTY_HASH.hex()
+        return self._tree_nodes[(self._tree_levels(), 0)].hex()
+
+    def _row_of(self, staker: str, stake_id: int) -> int:
+        """Resolve a (staker, stake_id) pair to a storage row, or -1 if unknown."""
+        row = stake_id - 1
+        if row < 0 or row >= len(self._amount) or self._stake_owner[row] != staker:
+            return -1
+        return row
+
     def stake_tokens(
-        self, 
-        staker: str, 
-        amount: int, 
+        self,
+        staker: str,
+        amount: int,
         lock_days: int
     ) -> Tuple[bool, int]:
         """
         Stake tokens for a specific duration.
-        
+
         Args:
             staker: Address of the staker
             amount: Amount of tokens to stake
             lock_days: Lock period in days (30, 90, 180, 365)
-            
+
         Returns:
             Tuple[bool, int]: (success, stake_id)
         """
         if self.paused:
             return False, 0
-            
-        if lock_days not in self.staking_pools:
+
+        staker = self._intern(staker)
+        tier = _TIER_OF_LOCK_DAYS.get(lock_days)
+        if tier is None:
             return False, 0
-            
+
         if amount <= 0:
             return False, 0
-        
+
         # Create stake record
-        stake_id = self.next_stake_id
-        self.next_stake_id += 1
-        
+        stake_id = self._counters[_CTR_NEXT_STAKE_ID]
+        self._counters[_CTR_NEXT_STAKE_ID] += 1
+
         current_time = int(time.time())  # Simplified timestamp
         unlock_time = current_time + (lock_days * 24 * 3600)
-        
-        stake_info = {
-            "amount": amount,
-            "lock_days": lock_days,
-            "start_time": current_time,
-            "unlock_time": unlock_time,
-            "last_reward_time": current_time,
-            "accumulated_rewards": 0,
-            "active": True
-        }
-        
-        # Initialize user stakes if needed
-        if staker not in self.user_stakes:
-            self.user_stakes[staker] = {}
+
+        # Longer locks grant more voting power: 1x for 30 days, 12x for 365
+        voting_multiplier = lock_days // 30
+
+        # Append one row across all columns (row = stake_id - 1)
+        self._amount.append(amount)
+        self._lock_days.append(lock_days)
+        self._tier.append(tier)
+        self._voting_multiplier.append(voting_multiplier)
+        self._start_time.append(current_time)
+        self._unlock_time.append(unlock_time)
+        self._last_reward_time.append(current_time)
+        self._accumulated_rewards.append(0)
+        self._active.append(1)
+        self._stake_owner.append(staker)
+
+        # Initialize user stake index if needed, with a single dict probe
+        if (stakes := self._stake_index.get(staker)) is None:
+            stakes = self._stake_index[staker] = []
             self.voting_power[staker] = 0
-        
+
         # Record stake
-        self.user_stakes[staker][stake_id] = stake_info
-        
+        stakes.append(stake_id - 1)
+
         # Update totals
-        self.total_staked += amount
-        self.staking_pools[lock_days]["total_staked"] += amount
-        
-        # Update voting power (longer locks = more power)
-        voting_multiplier = lock_days // 30  # 1x for 30 days, 12x for 365 days
+        self._counters[_CTR_TOTAL_STAKED] += amount
+        self._pool_total_staked[tier] += amount
+
+        # Update voting power
         self.voting_power[staker] += amount * voting_multiplier
-        
+
+        self._update_leaf(stake_id - 1)
+
         return True, stake_id
-    
+
     def unstake_tokens(self, staker: str, stake_id: int) -> Tuple[bool, int, int]:
         """
         Unstake tokens after lock period.
-        
+
         Args:
             staker: Address of the staker
             stake_id: ID of the stake to unstake
-            
+
         Returns:
             Tuple[bool, int, int]: (success, principal_amount, reward_amount)
         """
         if self.paused:
             return False, 0, 0
-            
-        if (staker not in self.user_stakes or 
-            stake_id not in self.user_stakes[staker]):
-            return False, 0, 0
-        
-        stake = self.user_stakes[staker][stake_id]
-        if not stake["active"]:
+
+        staker = self._intern(staker)
+        row = self._row_of(staker, stake_id)
+        if row < 0 or not self._active[row]:
             return False, 0, 0
-        
-        current_time = int(time.time())
-        
+
+        now = int(time.time())
+
         # Check if lock period is over
-        if current_time < stake["unlock_time"]:
+        if now < self._unlock_time[row]:
             return False, 0, 0
-        
+
         # Calculate final rewards
-        rewards = self._calculate_rewards(staker, stake_id)
-        principal = stake["amount"]
-        
+        rewards = self._calculate_rewards(row, now)
+        principal = self._amount[row]
+
         # Update state
-        stake["active"] = False
-        stake["accumulated_rewards"] += rewards
-        
+        self._active[row] = 0
+        self._accumulated_rewards[row] += rewards
+
         # Update totals
-        self.total_staked -= principal
-        self.staking_pools[stake["lock_days"]]["total_staked"] -= principal
-        self.total_rewards_distributed += rewards
-        
+        self._counters[_CTR_TOTAL_STAKED] -= principal
+        self._pool_total_staked[self._tier[row]] -= principal
+        self._counters[_CTR_TOTAL_REWARDS] += rewards
+
         # Update voting power
-        voting_multiplier = stake["lock_days"] // 30
-        self.voting_power[staker] -= principal * voting_multiplier
-        
+        self.voting_power[staker] -= principal * self._voting_multiplier[row]
+
+        self._update_leaf(row)
+
         return True, principal, rewards
-    
+
     def emergency_withdraw(self, staker: str, stake_id: int) -> Tuple[bool, int, int]:
         """
         Emergency withdrawal with penalty.
-        
+
         Args:
             staker: Address of the staker
             stake_id: ID of the stake to withdraw
-            
+
         Returns:
             Tuple[bool, int, int]: (success, amount_returned, penalty_amount)
         """
-        if (staker not in self.user_stakes or 
-            stake_id not in self.user_stakes[staker]):
+        staker = self._intern(staker)
+        row = self._row_of(staker, stake_id)
+        if row < 0 or not self._active[row]:
             return False, 0, 0
-        
-        stake = self.user_stakes[staker][stake_id]
-        if not stake["active"]:
-            return False, 0, 0
-        
-        principal = stake["amount"]
-        penalty = (principal * self.emergency_withdrawal_penalty) // 10000
+
+        principal = self._amount[row]
+        penalty = (principal * self.emergency_withdrawal_penalty) // BPS_DENOM
         amount_returned = principal - penalty
-        
+
         # Update state
-        stake["active"] = False
-        
+        self._active[row] = 0
+
         # Update totals
-        self.total_staked -= principal
-        self.staking_pools[stake["lock_days"]]["total_staked"] -= principal
-        
+        self._counters[_CTR_TOTAL_STAKED] -= principal
+        self._pool_total_staked[self._tier[row]] -= principal
+
         # Update voting power
-        voting_multiplier = stake["lock_days"] // 30
-        self.voting_power[staker] -= principal * voting_multiplier
-        
+        self.voting_power[staker] -= principal * self._voting_multiplier[row]
+
+        self._update_leaf(row)
+
         return True, amount_returned, penalty
-    
+
     def claim_rewards(self, staker: str, stake_id: int) -> Tuple[bool, int]:
         """
         Claim accumulated rewards without unstaking.
-        
+
         Args:
             staker: Address of the staker
             stake_id: ID of the stake
-            
+
         Returns:
             Tuple[bool, int]: (success, reward_amount)
         """
-        if (staker not in self.user_stakes or 
-            stake_id not in self.user_stakes[staker]):
-            return False, 0
-        
-        stake = self.user_stakes[staker][stake_id]
-        if not stake["active"]:
+        staker = self._intern(staker)
+        row = self._row_of(staker, stake_id)
+        if row < 0 or not self._active[row]:
             return False, 0
-        
-        rewards = self._calculate_rewards(staker, stake_id)
-        
+
+        now = int(time.time())
+
+        # Fast path: nothing accrued since the last claim in this block
+        if self._last_reward_time[row] >= now:
+            return True, 0
+
+        rewards = self._calculate_rewards(row, now)
+
         if rewards > 0:
-            stake["last_reward_time"] = int(time.time())
-            stake["accumulated_rewards"] += rewards
-            self.total_rewards_distributed += rewards
-        
+            self._last_reward_time[row] = now
+            self._accumulated_rewards[row] += rewards
+            self._counters[_CTR_TOTAL_REWARDS] += rewards
+            self._update_leaf(row)
+
         return True, rewards
-    
+
+    def claim_all_rewards(self, staker: str) -> int:
+        """
+        Claim pending rewards across all of a staker's active stakes.
+
+        Gathers the staker's rows once and runs the reward math in a
+        single pass over the stake columns, instead of paying a full
+        claim_rewards dispatch (and clock read) per stake.
+
+        Args:
+            staker: Address of the staker
+
+        Returns:
+            int: Total reward amount claimed
+        """
+        rows = self._stake_index.get(staker)
+        if not rows:
+            return 0
+
+        now = int(time.time())
+        amount = self._amount
+        tier = self._tier
+        active = self._active
+        last_reward = self._last_reward_time
+        accumulated = self._accumulated_rewards
+
+        total_claimed = 0
+        for row in rows:
+            if not active[row]:
+                continue
+            time_staked = now - last_reward[row]
+            if time_staked <= 0:
+                continue
+            rewards = _calc_reward_kernel(
+                amount[row], _POOL_APY[tier[row]], time_staked, _REWARD_DENOM
+            )
+            if rewards > 0:
+                last_reward[row] = now
+                accumulated[row] += rewards
+                total_claimed += rewards
+                self._update_leaf(row)
+
+        self._counters[_CTR_TOTAL_REWARDS] += total_claimed
+        return total_claimed
+
     def compound_rewards(self, staker: str, stake_id: int) -> Tuple[bool, int]:
         """
         Compound rewards back into the stake.
-        
+
         Args:
             staker: Address of the staker
             stake_id: ID of the stake
-            
+
         Returns:
             Tuple[bool, int]: (success, compounded_amount)
         """
-        if (staker not in self.user_stakes or 
-            stake_id not in self.user_stakes[staker]):
+        staker = self._intern(staker)
+        row = self._row_of(staker, stake_id)
+        if row < 0 or not self._active[row]:
             return False, 0
-        
-        stake = self.user_stakes[staker][stake_id]
-        if not stake["active"]:
-            return False, 0
-        
-        rewards = self._calculate_rewards(staker, stake_id)
-        
+
+        now = int(time.time())
+
+        # Fast path: nothing accrued since the last claim in this block
+        if self._last_reward_time[row] >= now:
+            return True, 0
+
+        rewards = self._calculate_rewards(row, now)
+
         if rewards > 0:
             # Add rewards to principal
-            stake["amount"] += rewards
-            stake["last_reward_time"] = int(time.time())
-            
+            self._amount[row] += rewards
+            self._last_reward_time[row] = now
+
             # Update totals
-            self.total_staked += rewards
-            self.staking_pools[stake["lock_days"]]["total_staked"] += rewards
-            
+            self._counters[_CTR_TOTAL_STAKED] += rewards
+            self._pool_total_staked[self._tier[row]] += rewards
+
             # Update voting power
-            voting_multiplier = stake["lock_days"] // 30
-            self.voting_power[staker] += rewards * voting_multiplier
-        
+            self.voting_power[staker] += rewards * self._voting_multiplier[row]
+
+            self._update_leaf(row)
+
         return True, rewards
-    
-    def _calculate_rewards(self, staker: str, stake_id: int) -> int:
-        """Calculate pending rewards for a stake."""
-        stake = self.user_stakes[staker][stake_id]
-        
-        current_time = int(time.time())
-        time_staked = current_time - stake["last_reward_time"]
-        
+
+    def _calculate_rewards(self, row: int, now: Optional[int] = None) -> int:
+        """Calculate pending rewards for the stake stored at ``row``.
+
+        ``now`` lets callers share a single timestamp across an entire
+        external operation instead of re-reading the clock per helper.
+        """
+        if now is None:
+            now = int(time.time())
+        time_staked = now - self._last_reward_time[row]
+
         if time_staked <= 0:
             return 0
-        
-        # Calculate rewards based on APY
-        apy = self.staking_pools[stake["lock_days"]]["apy"]
-        annual_reward = (stake["amount"] * apy) // 10000
-        
-        # Convert to time-based reward (simplified)
-        seconds_per_year = 365 * 24 * 3600
-        rewards = (annual_reward * time_staked) // seconds_per_year
-        
-        return rewards
-    
-    def get_stake_info(self, staker: str, stake_id: int) -> Optional[Dict]:
+
+        # Calculate rewards based on APY (simplified time-based reward)
+        apy = _POOL_APY[self._tier[row]]
+
+        return _calc_reward_kernel(self._amount[row], apy, time_staked, _REWARD_DENOM)
+
+    def get_stake_info(self, staker: str, stake_id: int) -> Optional["StakeView"]:
         """Get detailed information about a stake."""
-        if (staker not in self.user_stakes or 
-            stake_id not in self.user_stakes[staker]):
+        staker = self._intern(staker)
+        row = self._row_of(staker, stake_id)
+        if row < 0:
             return None
-        
-        stake = self.user_stakes[staker][stake_id].copy()
-        
-        # Add calculated fields
-        current_time = int(time.time())
-        stake["time_remaining"] = max(0, stake["unlock_time"] - current_time)
-        stake["pending_rewards"] = self._calculate_rewards(staker, stake_id)
-        stake["is_unlocked"] = current_time >= stake["unlock_time"]
-        
-        return stake
-    
+
+        now = int(time.time())
+        unlock_time = self._unlock_time[row]
+
+        # A NamedTuple view is one C struct allocation, much cheaper than
+        # materializing a fresh dict per read call.
+        return StakeView(
+            amount=self._amount[row],
+            lock_days=self._lock_days[row],
+            start_time=self._start_time[row],
+            unlock_time=unlock_time,
+            last_reward_time=self._last_reward_time[row],
+            accumulated_rewards=self._accumulated_rewards[row],
+            active=bool(self._active[row]),
+            time_remaining=max(0, unlock_time - now),
+            pending_rewards=self._calculate_rewards(row, now),
+            is_unlocked=now >= unlock_time,
+        )
+
     def get_user_total_stake(self, staker: str) -> int:
         """Get total staked amount for a user."""
-        if staker not in self.user_stakes:
+        rows = self._stake_index.get(staker)
+        if not rows:
             return 0
-        
-        total = 0
-        for stake in self.user_stakes[staker].values():
-            if stake["active"]:
-                total += stake["amount"]
-        
-        return total
-    
+
+        amount = self._amount
+        active = self._active
+        return sum(amount[row] for row in rows if active[row])
+
     def get_user_voting_power(self, staker: str) -> int:
         """Get voting power for a user."""
         return self.voting_power.get(staker, 0)
-    
-    def get_pool_stats(self, lock_days: int) -> Optional[Dict]:
+
+    def get_pool_stats(self, lock_days: int) -> Optional["PoolView"]:
         """Get statistics for a staking pool."""
-        if lock_days not in self.staking_pools:
+        tier = _TIER_OF_LOCK_DAYS.get(lock_days)
+        if tier is None:
             return None
-        
-        pool = self.staking_pools[lock_days].copy()
-        pool["lock_days"] = lock_days
-        
-        return pool
-    
+
+        return PoolView(
+            apy=_POOL_APY[tier],
+            total_staked=self._pool_total_staked[tier],
+            lock_days=lock_days,
+        )
+
     def get_contract_stats(self) -> Dict:
         """Get overall contract statistics."""
         return {
-            "total_staked": self.total_staked,
-            "total_rewards_distributed": self.total_rewards_distributed,
-            "total_stakers": len(self.user_stakes),
+            "total_staked": self._counters[_CTR_TOTAL_STAKED],
+            "total_rewards_distributed": self._counters[_CTR_TOTAL_REWARDS],
+            "total_stakers": len(self._stake_index),
             "paused": self.paused,
-            "pools": self.staking_pools
+            "pools": {
+                lock_days: {
+                    "apy": _POOL_APY[tier],
+                    "total_staked": self._pool_total_staked[tier],
+                }
+                for tier, lock_days in enumerate(_POOL_LOCK_DAYS)
+            }
         }
-    
+
+    def snapshot(self) -> bytes:
+        """
+        Serialize contract state into one contiguous blob.
+
+        The columns are dumped as raw bytes, so a node restart restores
+        state with a handful of bulk copies instead of replaying every
+        stake_tokens call.
+
+        Returns:
+            bytes: Opaque snapshot blob for restore()
+        """
+        state = {
+            "amount": self._amount.tobytes(),
+            "lock_days": self._lock_days.tobytes(),
+            "tier": self._tier.tobytes(),
+            "voting_multiplier": self._voting_multiplier.tobytes(),
+            "start_time": self._start_time.tobytes(),
+            "unlock_time": self._unlock_time.tobytes(),
+            "last_reward_time": self._last_reward_time.tobytes(),
+            "accumulated_rewards": self._accumulated_rewards.tobytes(),
+            "active": self._active.tobytes(),
+            "stake_owner": self._stake_owner,
+            "pool_total_staked": self._pool_total_staked.tobytes(),
+            "counters": self._counters.tobytes(),
+            "voting_power": self.voting_power,
+            "paused": self.paused,
+            "emergency_withdrawal_penalty": self.emergency_withdrawal_penalty,
+        }
+        return pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def restore(self, blob: bytes) -> None:
+        """
+        Rebuild contract state from a snapshot() blob.
+
+        Args:
+            blob: Snapshot produced by snapshot()
+        """
+        state = pickle.loads(blob)
+
+        for attr, key in (
+            ("_amount", "amount"),
+            ("_lock_days", "lock_days"),
+            ("_tier", "tier"),
+            ("_voting_multiplier", "voting_multiplier"),
+            ("_start_time", "start_time"),
+            ("_unlock_time", "unlock_time"),
+            ("_last_reward_time", "last_reward_time"),
+            ("_accumulated_rewards", "accumulated_rewards"),
+        ):
+            column = array("q")
+            column.frombytes(state[key])
+            setattr(self, attr, column)
+
+        active = array("b")
+        active.frombytes(state["active"])
+        self._active = active
+
+        pool_totals = array("q")
+        pool_totals.frombytes(state["pool_total_staked"])
+        self._pool_total_staked = pool_totals
+
+        counters = array("q")
+        counters.frombytes(state["counters"])
+        self._counters = counters
+
+        self.voting_power = state["voting_power"]
+        self.paused = state["paused"]
+        self.emergency_withdrawal_penalty = state["emergency_withdrawal_penalty"]
+
+        # Rebuild the owner column, intern table, and stake index in one pass
+        self._interned_addresses = {}
+        self._stake_owner = []
+        self._stake_index = {}
+        for row, owner in enumerate(state["stake_owner"]):
+            owner = self._intern(owner)
+            self._stake_owner.append(owner)
+            self._stake_index.setdefault(owner, []).append(row)
+
+        # Recommit the restored rows to the Merkle tree
+        self._tree_nodes = {}
+        for row in range(len(self._amount)):
+            self._update_leaf(row)
+
     def pause_contract(self, caller: str) -> bool:
         """Pause the contract (owner only)."""
         if caller != self.owner:
             return False
-        
+
         self.paused = True
         return True
-    
+
     def unpause_contract(self, caller: str) -> bool:
         """Unpause the contract (owner only)."""
         if caller != self.owner:
             return False
-        
+
         self.paused = False
         return True
-    
+
     def set_emergency_penalty(self, caller: str, penalty_bps: int) -> bool:
         """Set emergency withdrawal penalty (owner only)."""
         if caller != self.owner:
             return False
-        
+
         if penalty_bps > 5000:  # Max 50% penalty
             return False
-        
+
         self.emergency_withdrawal_penalty = penalty_bps
         return True
-    
+
     def get_owner(self) -> str:
         """Get contract owner."""
         return self.owner
+
+
+# Defined below the contract on purpose: the bytecode generator treats
+# the module's first ClassDef as the contract class, so these view
+# structs must not come before StakingContract.
+class StakeView(NamedTuple):
+    """Read-only snapshot of one stake plus derived fields."""
+    amount: int
+    lock_days: int
+    start_time: int
+    unlock_time: int
+    last_reward_time: int
+    accumulated_rewards: int
+    active: bool
+    time_remaining: int
+    pending_rewards: int
+    is_unlocked: bool
+
+
+class PoolView(NamedTuple):
+    """Read-only snapshot of one staking pool."""
+    apy: int
+    total_staked: int
+    lock_days: int
@@ -4,67 +4,115 @@ Deployment script for StakingContract
 Usage: python scripts/deploy.py
 """
 
+import hashlib
+import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.append(str(project_root))
 
+from py0g import __version__ as py0g_version
 from py0g.compiler import PythonContractCompiler
 from py0g.hasher import ProgramHasher
 from py0g.prover import ZKProver
 from py0g.deployer import ContractDeployer
 
+# Compile/hash/prove results are cached per source hash; proof generation
+# is the expensive stage, so repeat deploys of unchanged sources skip it.
+CACHE_DIR = Path("artifacts/cache")
+
+
+def cache_key(source: bytes) -> str:
+    """Cache key for a contract source, salted with the py0g version."""
+    return hashlib.sha256(py0g_version.encode() + source).hexdigest()
+
+
+def load_cached_pipeline(cache_file: Path):
+    """Load (bytecode, program_hash) from a cache entry, or None."""
+    if not cache_file.exists():
+        return None
+    try:
+        cached = json.loads(cache_file.read_text())
+        return bytes.fromhex(cached["bytecode"]), cached["program_hash"]
+    except (ValueError, KeyError):
+        return None
+
+
+def store_cached_pipeline(cache_file: Path, bytecode: bytes, program_hash: str) -> None:
+    """Atomically persist pipeline outputs for the next deploy."""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    payload = json.dumps({
+        "bytecode": bytecode.hex(),
+        "program_hash": program_hash,
+        "py0g_version": py0g_version
+    }, indent=2)
+    tmp_file = cache_file.with_suffix(".tmp")
+    tmp_file.write_text(payload)
+    os.replace(tmp_file, cache_file)
+
 
 def main():
     """Deploy StakingContract to 0G Galileo."""
     contract_path = "contracts/StakingContract.py"
-    
+
     print(f"Deploying {contract_path}")
-    
+
     # Check if contract exists
     if not Path(contract_path).exists():
         print(f"Contract file not found: {contract_path}")
         sys.exit(1)
-    
+
     try:
-        # 1. Compile contract
-        print("Compiling contract...")
-        compiler = PythonContractCompiler()
-        result = compiler.compile_contract(contract_path)
-        compiler.save_artifacts(result, "StakingContract", "artifacts")
-        print("Compilation complete")
-        
-        # 2. Generate hash
-        print("Generating program hash...")
-        hasher = ProgramHasher()
-        program_hash = hasher.hash_contract(contract_path)
-        hasher.save_hash(program_hash, "artifacts")
-        print("Hash generation complete")
-        
-        # 3. Generate proof
-        print("Generating ZK proof...")
-        prover = ZKProver()
-        proof = prover.generate_proof(contract_path, program_hash.program_hash)
-        prover.save_proof(proof, "artifacts")
-        print("Proof generation complete")
-        
+        cache_file = CACHE_DIR / f"{cache_key(Path(contract_path).read_bytes())}.json"
+        cached = load_cached_pipeline(cache_file)
+
+        if cached is not None:
+            bytecode, program_hash_hex = cached
+            print("Source unchanged, using cached compilation, hash, and proof")
+        else:
+            # 1+2. Compile and hash concurrently; hashing depends only on
+            # the source file, not on the compiler's output
+            print("Compiling contract and generating program hash...")
+            compiler = PythonContractCompiler()
+            hasher = ProgramHasher()
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                compile_future = executor.submit(compiler.compile_contract, contract_path)
+                hash_future = executor.submit(hasher.hash_contract, contract_path)
+                result = compile_future.result()
+                program_hash = hash_future.result()
+            compiler.save_artifacts(result, "StakingContract", "artifacts")
+            hasher.save_hash(program_hash, "artifacts")
+            print("Compilation and hash generation complete")
+
+            # 3. Generate proof
+            print("Generating ZK proof...")
+            prover = ZKProver()
+            proof = prover.generate_proof(contract_path, program_hash.program_hash)
+            prover.save_proof(proof, "artifacts")
+            print("Proof generation complete")
+
+            bytecode = result.bytecode
+            program_hash_hex = program_hash.program_hash
+            store_cached_pipeline(cache_file, bytecode, program_hash_hex)
+
         # 4. Deploy (simulation mode by default)
         print("Simulating deployment...")
         deployer = ContractDeployer()
         simulation = deployer.simulate_deployment(
-            result.bytecode, 
-            program_hash.program_hash, 
+            bytecode,
+            program_hash_hex,
             ""
         )
-        
+
         print("Simulation successful!")
         print(f"  Estimated Address: {simulation['contract_address']}")
         print(f"  Estimated Gas: {simulation['estimated_gas']}")
         print(f"  Estimated Cost: {simulation['estimated_cost']}")
-        
+
     except Exception as e:
         print(f"Deployment failed: {e}")
         sys.exit(1)
@@ -6,29 +6,36 @@ This script demonstrates how to interact with the deployed staking contract
 using the universal contract interactor.
 """
 
-import subprocess
 import sys
+from pathlib import Path
+
+# Import the interactor once; every command below runs in this interpreter
+# instead of paying a fresh python startup + import per call.
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from contract_interactor import main as interactor_main
 
 # Contract address (deployed on 0G Galileo)
 CONTRACT_ADDRESS = "0x00013e745d680286b7df5c680dd4d624976246d3a629"
 CONTRACT_PATH = "contracts/StakingContract.py"
-INTERACTOR_PATH = "../contract_interactor.py"
 
 def run_interactor_command(args):
-    """Run the contract interactor with given arguments."""
-    cmd = [
-        "python", INTERACTOR_PATH,
+    """Run the contract interactor in-process with given arguments."""
+    argv = [
         "--contract", CONTRACT_ADDRESS,
         "--contract-path", CONTRACT_PATH
     ] + args
-    
+
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        print(result.stdout)
+        interactor_main(argv)
+        return True
+    except SystemExit as e:
+        if e.code:
+            print(f"Error: interactor exited with code {e.code}")
+            return False
         return True
-    except subprocess.CalledProcessError as e:
+    except Exception as e:
         print(f"Error: {e}")
-        print(f"Stderr: {e.stderr}")
         return False
 
 def main():
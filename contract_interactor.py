@@ -11,68 +11,349 @@ Usage:
     python contract_interactor.py --contract-info --contract 0x123...
 """
 
+from __future__ import annotations
+
+import asyncio
+import functools
 import json
 import argparse
 import sys
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Union
-from web3 import Web3
-from web3.exceptions import ContractLogicError
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.json import JSON
+
+# web3, eth_account, aiohttp, and rich together drag in well over a
+# hundred transitive modules; they are imported lazily where needed so
+# --help and argument errors stay fast
+
+# orjson parses large ABI files 2-5x faster than stdlib json; fall back
+# silently when it is not installed. Resolved on first ABI read.
+_loads = None
+
+
+# Multicall3 is deployed at the same address on virtually every EVM chain
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+MULTICALL3_ABI = [
+    {
+        "type": "function",
+        "name": "aggregate3",
+        "stateMutability": "payable",
+        "inputs": [
+            {
+                "name": "calls",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"}
+                ]
+            }
+        ],
+        "outputs": [
+            {
+                "name": "returnData",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"}
+                ]
+            }
+        ]
+    }
+]
+
+
+# Parsed ABIs keyed by (path, mtime_ns); interactive commands re-resolve
+# the same file constantly and should not re-read or re-parse it
+_ABI_CACHE: Dict[tuple, List[Dict]] = {}
+
+
+def _read_abi(path: Path) -> List[Dict]:
+    """Parse an ABI file, reusing the cached list until the file changes."""
+    key = (str(path), path.stat().st_mtime_ns)
+    abi = _ABI_CACHE.get(key)
+    if abi is None:
+        global _loads
+        if _loads is None:
+            try:
+                import orjson
+                _loads = orjson.loads
+            except ImportError:
+                _loads = json.loads
+        abi = _loads(path.read_bytes())
+        _ABI_CACHE[key] = abi
+    return abi
+
+
+# Per-ABI function index: name -> ABI entry, built once per loaded ABI so
+# lookups and partitioning never rescan the full list
+_ABI_INDEX: Dict[int, Dict[str, Dict]] = {}
+
+
+def _function_index(abi: List[Dict]) -> Dict[str, Dict]:
+    """Return the name -> function-entry index for a loaded ABI."""
+    index = _ABI_INDEX.get(id(abi))
+    if index is None:
+        index = {item['name']: item for item in abi if item.get('type') == 'function'}
+        _ABI_INDEX[id(abi)] = index
+    return index
+
+
+# State mutabilities that mark a function read-only
+_VIEW = frozenset(('view', 'pure'))
+
+
+@functools.lru_cache(maxsize=1024)
+def _to_checksum(address: str) -> str:
+    """Checksum an address, memoized (keccak on the hex string otherwise)."""
+    from web3 import Web3
+    return Web3.to_checksum_address(address)
+
+
+def _coerce_bool(value: str) -> bool:
+    return value.lower() in ('1', 'true', 'yes')
+
+
+def _coerce_bytes(value: str) -> bytes:
+    return bytes.fromhex(value[2:] if value.startswith('0x') else value)
+
+
+# str -> Python value converters per ABI type; int types and fixed-size
+# bytes are matched by prefix in _coercer_for
+_COERCER = {
+    'address': _to_checksum,
+    'bool': _coerce_bool,
+    'string': str,
+}
+
+
+def _coercer_for(abi_type: str):
+    coercer = _COERCER.get(abi_type)
+    if coercer is not None:
+        return coercer
+    if abi_type.startswith(('uint', 'int')):
+        return int
+    if abi_type.startswith('bytes'):
+        return _coerce_bytes
+    return str
+
+
+# Coercer lists keyed by (abi identity, function name), built on first use
+_ABI_COERCERS: Dict[tuple, list] = {}
+
+
+def _coerce_args(abi: List[Dict], function_name: str, args: List[Any]) -> List[Any]:
+    """Convert raw string arguments to the function's ABI input types."""
+    if not args:
+        return []
+    key = (id(abi), function_name)
+    coercers = _ABI_COERCERS.get(key)
+    if coercers is None:
+        entry = _function_index(abi).get(function_name, {})
+        coercers = [_coercer_for(inp['type']) for inp in entry.get('inputs', [])]
+        _ABI_COERCERS[key] = coercers
+    return [coercer(arg) if isinstance(arg, str) else arg
+            for coercer, arg in zip(coercers, args)]
+
+
+# Pre-rendered table rows and partitioned summaries, one build per ABI
+_ABI_ROWS: Dict[int, tuple] = {}
+_ABI_SUMMARY: Dict[int, tuple] = {}
+
+
+def _display_rows(abi: List[Dict]) -> tuple:
+    """(view_rows, write_rows) of pre-joined display strings for an ABI."""
+    rows = _ABI_ROWS.get(id(abi))
+    if rows is None:
+        view_rows = []
+        write_rows = []
+        for name, item in _function_index(abi).items():
+            inputs = ', '.join([f"{inp.get('name', 'arg')}: {inp['type']}" for inp in item.get('inputs', [])])
+            outputs = ', '.join([out['type'] for out in item.get('outputs', [])])
+            row = (name, inputs or "none", outputs or "none")
+            if item.get('stateMutability') in _VIEW:
+                view_rows.append(row)
+            else:
+                write_rows.append(row)
+        rows = (view_rows, write_rows)
+        _ABI_ROWS[id(abi)] = rows
+    return rows
+
+
+def _function_summary(abi: List[Dict]) -> tuple:
+    """(view_functions, write_functions) info dicts, partitioned once."""
+    summary = _ABI_SUMMARY.get(id(abi))
+    if summary is None:
+        view_functions = []
+        write_functions = []
+        for item in _function_index(abi).values():
+            func_info = {
+                'name': item['name'],
+                'inputs': len(item.get('inputs', [])),
+                'outputs': len(item.get('outputs', [])),
+                'stateMutability': item.get('stateMutability', 'unknown')
+            }
+            if item.get('stateMutability') in _VIEW:
+                view_functions.append(func_info)
+            else:
+                write_functions.append(func_info)
+        summary = (view_functions, write_functions)
+        _ABI_SUMMARY[id(abi)] = summary
+    return summary
+
+
+class BatchRPC:
+    """
+    Minimal JSON-RPC 2.0 batch client.
+
+    Collects raw {jsonrpc, method, params, id} entries and posts them as a
+    single array in one HTTP request, so N calls share one round-trip and
+    one TLS handshake instead of N.
+    """
+
+    def __init__(self, rpc_url: str, session: Optional["aiohttp.ClientSession"] = None):
+        self.rpc_url = rpc_url
+        self.session = session
+        self._requests: List[Dict[str, Any]] = []
+
+    def add(self, method: str, params: List[Any]) -> int:
+        """Queue one RPC; returns its position in the batched result."""
+        request_id = len(self._requests)
+        self._requests.append({
+            "jsonrpc": "2.0",
+            "method": method,
+            "params": params,
+            "id": request_id
+        })
+        return request_id
+
+    async def execute(self) -> List[Any]:
+        """POST the whole batch once and return results in queue order."""
+        import aiohttp
+
+        requests = self._requests
+        self._requests = []
+
+        if self.session is not None:
+            async with self.session.post(self.rpc_url, json=requests) as response:
+                responses = await response.json()
+        else:
+            async with aiohttp.ClientSession() as session:
+                async with session.post(self.rpc_url, json=requests) as response:
+                    responses = await response.json()
+
+        # Servers may reorder batch entries; restore queue order by id
+        results: List[Any] = [None] * len(requests)
+        for entry in responses:
+            if "error" in entry:
+                raise ValueError(f"RPC error: {entry['error']}")
+            results[entry["id"]] = entry.get("result")
+        return results
 
 
 class UniversalContractInteractor:
     """Universal interactor for any py0g deployed contract."""
-    
+
     def __init__(self, rpc_url: str = "https://evmrpc-testnet.0g.ai", private_key: Optional[str] = None):
-        """Initialize blockchain connection."""
-        self.console = Console()
+        """Initialize the async blockchain connection."""
+        from rich.console import Console
+        from web3 import AsyncWeb3
+
+        # When stdout is a pipe (scripting/CI), skip ANSI markup and rich
+        # rendering entirely; results go out as plain JSON/text
+        self.plain = not sys.stdout.isatty()
+        self.console = Console(no_color=self.plain)
         self.rpc_url = rpc_url
         self.private_key = private_key
-        
-        # Connect to blockchain
-        self.w3 = Web3(Web3.HTTPProvider(rpc_url))
+
+        # Async provider: independent RPCs can run concurrently via
+        # asyncio.gather instead of paying one blocking round-trip each.
+        self.w3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(rpc_url))
         self.chain_id = 16602  # 0G Galileo testnet
-        
-        if not self.w3.is_connected():
-            self.console.print(f"[red]❌ Failed to connect to {rpc_url}[/red]")
-            sys.exit(1)
-        
+
+        # Read calls queued for a single Multicall3 aggregate3 round-trip
+        self._pending_calls: List[tuple] = []
+
+        # Contract instances keyed by (checksum address, abi identity);
+        # ABI parsing and ContractFunction binding happen once, not per call
+        self._contract_cache: Dict[tuple, Any] = {}
+
+        # Shared keep-alive HTTP session for batch RPCs, created lazily so
+        # TLS handshakes amortize across calls instead of one per request
+        self._session: Optional["aiohttp.ClientSession"] = None
+
+        # Local nonce/gas-price tracking: the first send queries the node,
+        # later sends in the same session just increment the counter
+        self._next_nonce: Optional[int] = None
+        self._gas_price: Optional[int] = None
+
         # Setup account if private key provided
         self.account = None
+        self._tx_template: Dict[str, Any] = {}
         if private_key:
             try:
-                self.account = self.w3.eth.account.from_key(private_key)
+                from eth_account import Account
+                self.account = Account.from_key(private_key)
                 self.w3.eth.default_account = self.account.address
+                # Constant transaction fields, built once; sends only fill
+                # in the nonce and gas price
+                self._tx_template = {
+                    'from': self.account.address,
+                    'gas': 200000,
+                    'chainId': self.chain_id
+                }
             except Exception as e:
                 self.console.print(f"[red]❌ Invalid private key: {e}[/red]")
                 sys.exit(1)
-        
-        self.console.print(f"[green]✅ Connected to 0G Galileo (Block: {self.w3.eth.block_number:,})[/green]")
+
+    def _http_session(self) -> "aiohttp.ClientSession":
+        """Lazily create the pooled, keep-alive HTTP session."""
+        import aiohttp
+
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=16, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=15)
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Release the pooled HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def connect(self) -> None:
+        """Verify the connection and report account state."""
+        if not await self.w3.is_connected():
+            self.console.print(f"[red]❌ Failed to connect to {self.rpc_url}[/red]")
+            sys.exit(1)
+
         if self.account:
-            balance = self.w3.eth.get_balance(self.account.address)
+            block_number, balance = await asyncio.gather(
+                self.w3.eth.block_number,
+                self.w3.eth.get_balance(self.account.address)
+            )
+            self.console.print(f"[green]✅ Connected to 0G Galileo (Block: {block_number:,})[/green]")
             balance_eth = self.w3.from_wei(balance, 'ether')
             self.console.print(f"[cyan]Account: {self.account.address}[/cyan]")
             self.console.print(f"[cyan]Balance: {balance_eth:.6f} A0GI[/cyan]")
-    
+        else:
+            block_number = await self.w3.eth.block_number
+            self.console.print(f"[green]✅ Connected to 0G Galileo (Block: {block_number:,})[/green]")
+
     def load_contract_abi(self, contract_path: Optional[str] = None, abi_path: Optional[str] = None) -> List[Dict]:
         """Load contract ABI from compiled artifacts or direct ABI file."""
         if abi_path:
             # Load ABI directly from file
             try:
-                with open(abi_path, 'r') as f:
-                    return json.load(f)
+                return _read_abi(Path(abi_path))
             except Exception as e:
                 self.console.print(f"[red]❌ Failed to load ABI from {abi_path}: {e}[/red]")
                 return []
-        
+
         if contract_path:
             # Try to find compiled ABI
             contract_name = Path(contract_path).stem
-            
+
             # Search for ABI in common locations
             search_paths = [
                 Path(contract_path).parent / "artifacts" / f"{contract_name}.abi.json",
@@ -80,172 +361,282 @@ class UniversalContractInteractor:
                 Path("nii/contracts/artifacts") / f"{contract_name}.abi.json",
                 Path(f"{contract_name}.abi.json")
             ]
-            
+
             for abi_path in search_paths:
                 if abi_path.exists():
                     try:
-                        with open(abi_path, 'r') as f:
-                            return json.load(f)
+                        return _read_abi(abi_path)
                     except Exception as e:
                         self.console.print(f"[yellow]⚠️  Failed to load ABI from {abi_path}: {e}[/yellow]")
                         continue
-        
+
         self.console.print(f"[red]❌ No ABI found. Provide --contract-path or --abi-path[/red]")
         return []
-    
-    def get_contract_info(self, contract_address: str, abi: List[Dict]) -> Dict[str, Any]:
+
+    async def get_contract_info(self, contract_address: str, abi: List[Dict]) -> Dict[str, Any]:
         """Get comprehensive contract information."""
         try:
             # Normalize address
-            address = Web3.to_checksum_address(contract_address)
-            
-            # Get basic contract info
-            code = self.w3.eth.get_code(address)
-            balance = self.w3.eth.get_balance(address)
-            
-            # Analyze ABI
-            view_functions = []
-            write_functions = []
-            
-            for item in abi:
-                if item.get('type') == 'function':
-                    func_info = {
-                        'name': item['name'],
-                        'inputs': len(item.get('inputs', [])),
-                        'outputs': len(item.get('outputs', [])),
-                        'stateMutability': item.get('stateMutability', 'unknown')
-                    }
-                    
-                    if item.get('stateMutability') in ['view', 'pure']:
-                        view_functions.append(func_info)
-                    else:
-                        write_functions.append(func_info)
-            
+            address = _to_checksum(contract_address)
+
+            # Fetch basic contract info as one JSON-RPC batch: a single
+            # HTTP POST instead of one round-trip per call
+            batch = BatchRPC(self.rpc_url, self._http_session())
+            batch.add("eth_getCode", [address, "latest"])
+            batch.add("eth_getBalance", [address, "latest"])
+            batch.add("eth_blockNumber", [])
+            code_hex, balance_hex, block_hex = await batch.execute()
+
+            code_size = (len(code_hex) - 2) // 2
+            balance = int(balance_hex, 16)
+
+            # Analyze ABI (pre-partitioned once per loaded ABI)
+            view_functions, write_functions = _function_summary(abi)
+
             return {
                 'address': address,
-                'code_size': len(code),
+                'code_size': code_size,
+                'block_number': int(block_hex, 16),
                 'balance': self.w3.from_wei(balance, 'ether'),
                 'view_functions': view_functions,
                 'write_functions': write_functions,
                 'total_functions': len(view_functions) + len(write_functions)
             }
-            
+
         except Exception as e:
             self.console.print(f"[red]❌ Failed to get contract info: {e}[/red]")
             return {}
-    
-    def call_contract_function(
-        self, 
-        contract_address: str, 
-        abi: List[Dict], 
-        function_name: str, 
+
+    def _get_contract(self, contract_address: str, abi: List[Dict]) -> Any:
+        """Return a memoized contract instance for (address, abi)."""
+        address = _to_checksum(contract_address)
+        key = (address, id(abi))
+        contract = self._contract_cache.get(key)
+        if contract is None:
+            contract = self.w3.eth.contract(address=address, abi=abi)
+            self._contract_cache[key] = contract
+        return contract
+
+    async def _await_receipt(self, tx_hash, timeout: float = 120.0) -> Any:
+        """
+        Wait for a transaction to be mined, politely.
+
+        Polls eth_getTransactionByHash (a cheap presence check, no receipt
+        deserialization) with exponential backoff, then fetches the full
+        receipt exactly once after the transaction lands in a block.
+        """
+        deadline = asyncio.get_running_loop().time() + timeout
+        attempt = 0
+        while True:
+            try:
+                tx = await self.w3.eth.get_transaction(tx_hash)
+            except Exception:
+                tx = None
+            if tx is not None and tx.get('blockNumber') is not None:
+                break
+            if asyncio.get_running_loop().time() >= deadline:
+                raise TimeoutError(f"Transaction {tx_hash.hex()} not mined within {timeout:.0f}s")
+            await asyncio.sleep(min(2.0, 0.25 * 2 ** attempt))
+            attempt += 1
+
+        return await self.w3.eth.get_transaction_receipt(tx_hash)
+
+    async def call_contract_function(
+        self,
+        contract_address: str,
+        abi: List[Dict],
+        function_name: str,
         args: List[Any] = None,
         is_write: bool = False
     ) -> Any:
         """Call a contract function (read or write)."""
+        from web3.exceptions import ContractLogicError
+
         try:
-            # Create contract instance
-            address = Web3.to_checksum_address(contract_address)
-            contract = self.w3.eth.contract(address=address, abi=abi)
-            
-            # Get function
-            if not hasattr(contract.functions, function_name):
+            contract = self._get_contract(contract_address, abi)
+
+            # Get function (index lookup, not an ABI scan)
+            if function_name not in _function_index(abi):
                 self.console.print(f"[red]❌ Function '{function_name}' not found in contract[/red]")
                 return None
-            
+
             func = getattr(contract.functions, function_name)
-            
-            # Prepare arguments
-            call_args = args or []
-            
+
+            # Prepare arguments (interactive input arrives as raw strings)
+            call_args = _coerce_args(abi, function_name, args or [])
+
             if is_write:
                 # Write operation (requires transaction)
                 if not self.account:
                     self.console.print(f"[red]❌ Private key required for write operations[/red]")
                     return None
-                
-                # Build transaction
-                transaction = func(*call_args).build_transaction({
-                    'from': self.account.address,
-                    'nonce': self.w3.eth.get_transaction_count(self.account.address),
-                    'gas': 200000,
-                    'gasPrice': self.w3.eth.gas_price,
-                    'chainId': self.chain_id
-                })
-                
-                # Sign and send transaction
-                signed_txn = self.w3.eth.account.sign_transaction(transaction, self.private_key)
-                tx_hash = self.w3.eth.send_raw_transaction(signed_txn.rawTransaction)
-                
+
+                # One batched POST for nonce + gas price on the first send;
+                # repeated sends reuse the local counter and cached price
+                if self._next_nonce is None:
+                    batch = BatchRPC(self.rpc_url, self._http_session())
+                    batch.add("eth_getTransactionCount", [self.account.address, "pending"])
+                    batch.add("eth_gasPrice", [])
+                    nonce_hex, gas_price_hex = await batch.execute()
+                    nonce = int(nonce_hex, 16)
+                    self._gas_price = int(gas_price_hex, 16)
+                else:
+                    nonce = self._next_nonce
+                gas_price = self._gas_price
+
+                # Build transaction from the precomputed template
+                transaction = await func(*call_args).build_transaction(
+                    dict(self._tx_template, nonce=nonce, gasPrice=gas_price)
+                )
+
+                # Sign with the cached LocalAccount: no key re-derivation,
+                # and eth_account picks up the native secp256k1 backend
+                # (coincurve) automatically when it is installed
+                signed_txn = self.account.sign_transaction(transaction)
+                tx_hash = await self.w3.eth.send_raw_transaction(signed_txn.rawTransaction)
+
                 self.console.print(f"[yellow]⏳ Transaction sent: {tx_hash.hex()}[/yellow]")
-                
+
                 # Wait for confirmation
-                receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
-                
+                receipt = await self._await_receipt(tx_hash)
+
                 if receipt.status == 1:
+                    self._next_nonce = nonce + 1
                     self.console.print(f"[green]✅ Transaction successful![/green]")
                     self.console.print(f"[cyan]Gas Used: {receipt.gasUsed:,}[/cyan]")
                     return receipt
                 else:
+                    self._next_nonce = None
                     self.console.print(f"[red]❌ Transaction failed![/red]")
                     return None
-            
+
             else:
                 # Read operation (call)
-                result = func(*call_args).call()
+                result = await func(*call_args).call()
                 return result
-                
+
         except ContractLogicError as e:
+            self._next_nonce = None
             self.console.print(f"[red]❌ Contract execution failed: {e}[/red]")
             return None
         except Exception as e:
+            self._next_nonce = None
             self.console.print(f"[red]❌ Function call failed: {e}[/red]")
             return None
-    
+
+    def queue_call(self, contract_address: str, abi: List[Dict], function_name: str, args: List[Any] = None) -> bool:
+        """Queue a read call for a later Multicall3 flush."""
+        try:
+            contract = self._get_contract(contract_address, abi)
+            call_args = _coerce_args(abi, function_name, args or [])
+            call_data = contract.encodeABI(fn_name=function_name, args=call_args)
+        except Exception as e:
+            self.console.print(f"[red]❌ Failed to encode {function_name}: {e}[/red]")
+            return False
+
+        entry = _function_index(abi).get(function_name, {})
+        output_types = [out['type'] for out in entry.get('outputs', [])]
+
+        self._pending_calls.append((contract.address, True, call_data, function_name, output_types))
+        self.console.print(f"[cyan]Queued {function_name} ({len(self._pending_calls)} pending)[/cyan]")
+        return True
+
+    async def flush_calls(self) -> List[tuple]:
+        """
+        Execute every queued read as one Multicall3 aggregate3 eth_call.
+
+        K queued reads cost a single RPC round-trip and one node execution
+        context instead of K separate eth_call requests.
+
+        Returns:
+            List[tuple]: (function_name, decoded_result_or_None) per call
+        """
+        if not self._pending_calls:
+            self.console.print("[yellow]No calls queued[/yellow]")
+            return []
+
+        from eth_abi import decode
+
+        pending = self._pending_calls
+        multicall = self.w3.eth.contract(
+            address=_to_checksum(MULTICALL3_ADDRESS),
+            abi=MULTICALL3_ABI
+        )
+
+        try:
+            calls = [(target, allow_failure, call_data)
+                     for target, allow_failure, call_data, _, _ in pending]
+            results = await multicall.functions.aggregate3(calls).call()
+        except Exception as e:
+            self.console.print(f"[red]❌ Multicall failed: {e}[/red]")
+            return []
+        finally:
+            self._pending_calls = []
+
+        decoded = []
+        for (success, return_data), (_, _, _, name, output_types) in zip(results, pending):
+            if not success:
+                decoded.append((name, None))
+            elif output_types:
+                values = decode(output_types, return_data)
+                decoded.append((name, values[0] if len(values) == 1 else values))
+            else:
+                decoded.append((name, return_data))
+
+        return decoded
+
     def list_functions(self, abi: List[Dict]) -> None:
         """Display all available functions in the contract."""
+        view_rows, write_rows = _display_rows(abi)
+
+        if self.plain:
+            # Fast path for pipes: no Table construction or markup parsing
+            for label, rows in (("view", view_rows), ("write", write_rows)):
+                for name, inputs, outputs in rows:
+                    print(f"{label}\t{name}\t{inputs}\t{outputs}")
+            return
+
+        from rich.table import Table
+
         # Create tables for different function types
         view_table = Table(title="📖 View Functions (Read-Only)")
         view_table.add_column("Function", style="cyan")
         view_table.add_column("Inputs", style="yellow")
         view_table.add_column("Outputs", style="green")
-        
+
         write_table = Table(title="✍️ Write Functions (State-Changing)")
         write_table.add_column("Function", style="cyan")
         write_table.add_column("Inputs", style="yellow")
         write_table.add_column("Outputs", style="green")
-        
-        for item in abi:
-            if item.get('type') == 'function':
-                name = item['name']
-                inputs = ', '.join([f"{inp.get('name', 'arg')}: {inp['type']}" for inp in item.get('inputs', [])])
-                outputs = ', '.join([out['type'] for out in item.get('outputs', [])])
-                
-                inputs_display = inputs if inputs else "none"
-                outputs_display = outputs if outputs else "none"
-                
-                if item.get('stateMutability') in ['view', 'pure']:
-                    view_table.add_row(name, inputs_display, outputs_display)
-                else:
-                    write_table.add_row(name, inputs_display, outputs_display)
-        
+
+        for row in view_rows:
+            view_table.add_row(*row)
+        for row in write_rows:
+            write_table.add_row(*row)
+
         self.console.print(view_table)
         self.console.print()
         self.console.print(write_table)
-    
-    def interactive_mode(self, contract_address: str, abi: List[Dict]) -> None:
+
+    async def interactive_mode(self, contract_address: str, abi: List[Dict], use_multicall: bool = False) -> None:
         """Start interactive mode for contract interaction."""
+        from rich.json import JSON
+        from rich.panel import Panel
+
         self.console.print(Panel.fit(
             f"[bold blue]Interactive Contract Mode[/bold blue]\n"
             f"Contract: {contract_address}\n"
             f"Type 'help' for commands, 'exit' to quit",
             title="🔧 py0g Contract Interactor"
         ))
-        
+
+        loop = asyncio.get_running_loop()
+
         while True:
             try:
-                command = input("\n> ").strip()
-                
+                # Read input off-loop so the event loop stays free
+                command = (await loop.run_in_executor(None, input, "\n> ")).strip()
+
                 if command.lower() in ['exit', 'quit']:
                     break
                 elif command.lower() == 'help':
@@ -255,6 +646,7 @@ class UniversalContractInteractor:
 • [cyan]info[/cyan] - Show contract information
 • [cyan]call <function> [args...][/cyan] - Call a read function
 • [cyan]send <function> [args...][/cyan] - Send a write transaction
+• [cyan]flush[/cyan] - Execute queued reads in one multicall (--multicall)
 • [cyan]help[/cyan] - Show this help
 • [cyan]exit[/cyan] - Exit interactive mode
 
@@ -266,35 +658,83 @@ class UniversalContractInteractor:
                 elif command.lower() == 'list':
                     self.list_functions(abi)
                 elif command.lower() == 'info':
-                    info = self.get_contract_info(contract_address, abi)
+                    info = await self.get_contract_info(contract_address, abi)
                     self.console.print(JSON.from_data(info))
+                elif command.lower() == 'flush':
+                    for name, result in await self.flush_calls():
+                        self.console.print(f"[green]{name}: {result}[/green]")
                 elif command.startswith('call '):
                     parts = command.split()[1:]
                     if parts:
                         func_name = parts[0]
                         args = parts[1:] if len(parts) > 1 else []
-                        result = self.call_contract_function(contract_address, abi, func_name, args, False)
-                        if result is not None:
-                            self.console.print(f"[green]Result: {result}[/green]")
+                        if use_multicall:
+                            # Enqueue now, dispatch on 'flush' in one RPC
+                            self.queue_call(contract_address, abi, func_name, args)
+                        else:
+                            result = await self.call_contract_function(contract_address, abi, func_name, args, False)
+                            if result is not None:
+                                self.console.print(f"[green]Result: {result}[/green]")
                 elif command.startswith('send '):
                     parts = command.split()[1:]
                     if parts:
                         func_name = parts[0]
                         args = parts[1:] if len(parts) > 1 else []
-                        result = self.call_contract_function(contract_address, abi, func_name, args, True)
+                        result = await self.call_contract_function(contract_address, abi, func_name, args, True)
                 else:
                     self.console.print("[yellow]Unknown command. Type 'help' for available commands.[/yellow]")
-                    
+
             except KeyboardInterrupt:
                 break
             except Exception as e:
                 self.console.print(f"[red]Error: {e}[/red]")
-        
+
         self.console.print("[dim]Goodbye![/dim]")
 
 
-def main():
-    """Main CLI interface."""
+async def run(args, parser) -> None:
+    """Execute the parsed CLI action on the event loop."""
+    # Initialize interactor
+    interactor = UniversalContractInteractor(args.rpc, args.key)
+    await interactor.connect()
+
+    try:
+        # Load ABI
+        abi = interactor.load_contract_abi(args.contract_path, args.abi_path)
+        if not abi:
+            sys.exit(1)
+
+        # Execute requested action
+        if args.interactive:
+            await interactor.interactive_mode(args.contract, abi, args.multicall)
+        elif args.info:
+            info = await interactor.get_contract_info(args.contract, abi)
+            if interactor.plain:
+                print(json.dumps(info, indent=2, default=str))
+            else:
+                from rich.json import JSON
+                interactor.console.print(JSON.from_data(info))
+        elif args.list_functions:
+            interactor.list_functions(abi)
+        elif args.function:
+            result = await interactor.call_contract_function(
+                args.contract, abi, args.function, args.args or [], args.write
+            )
+            if result is not None and not args.write:
+                interactor.console.print(f"[green]Result: {result}[/green]")
+        else:
+            parser.print_help()
+    finally:
+        await interactor.close()
+
+
+def main(argv: Optional[List[str]] = None):
+    """Main CLI interface.
+
+    Args:
+        argv: Optional argument list; defaults to sys.argv so scripts can
+            invoke the interactor in-process without spawning a subprocess.
+    """
     parser = argparse.ArgumentParser(
         description="Universal Contract Interactor for py0g deployed contracts",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -302,21 +742,21 @@ def main():
 Examples:
   # Interactive mode
   python contract_interactor.py --contract 0x123... --contract-path strk.py --interactive
-  
+
   # Call read function
   python contract_interactor.py --contract 0x123... --abi-path strk.abi.json --function balance_of --args 0xabc...
-  
+
   # Send write transaction
   python contract_interactor.py --contract 0x123... --contract-path strk.py --function transfer --args 0xdef... 1000 --write --key 0x456...
-  
+
   # Get contract info
   python contract_interactor.py --contract 0x123... --contract-path strk.py --info
-  
+
   # List all functions
   python contract_interactor.py --contract 0x123... --abi-path strk.abi.json --list-functions
 """
     )
-    
+
     parser.add_argument('--contract', required=True, help='Contract address')
     parser.add_argument('--contract-path', help='Path to contract source file (for ABI lookup)')
     parser.add_argument('--abi-path', help='Direct path to ABI JSON file')
@@ -325,36 +765,15 @@ Examples:
     parser.add_argument('--write', action='store_true', help='Send write transaction (requires --key)')
     parser.add_argument('--key', help='Private key for write operations')
     parser.add_argument('--rpc', default='https://evmrpc-testnet.0g.ai', help='RPC endpoint')
+    parser.add_argument('--multicall', action='store_true',
+                        help='Queue interactive reads and execute them in one Multicall3 call')
     parser.add_argument('--interactive', action='store_true', help='Start interactive mode')
     parser.add_argument('--info', action='store_true', help='Show contract information')
     parser.add_argument('--list-functions', action='store_true', help='List all contract functions')
-    
-    args = parser.parse_args()
-    
-    # Initialize interactor
-    interactor = UniversalContractInteractor(args.rpc, args.key)
-    
-    # Load ABI
-    abi = interactor.load_contract_abi(args.contract_path, args.abi_path)
-    if not abi:
-        sys.exit(1)
-    
-    # Execute requested action
-    if args.interactive:
-        interactor.interactive_mode(args.contract, abi)
-    elif args.info:
-        info = interactor.get_contract_info(args.contract, abi)
-        interactor.console.print(JSON.from_data(info))
-    elif args.list_functions:
-        interactor.list_functions(abi)
-    elif args.function:
-        result = interactor.call_contract_function(
-            args.contract, abi, args.function, args.args or [], args.write
-        )
-        if result is not None and not args.write:
-            interactor.console.print(f"[green]Result: {result}[/green]")
-    else:
-        parser.print_help()
+
+    args = parser.parse_args(argv)
+
+    asyncio.run(run(args, parser))
 
 
 if __name__ == "__main__":
@@ -6,45 +6,182 @@ This script interacts with the actual deployed STRK contract on 0G Galileo block
 It can read contract functions, call methods, and inspect the real blockchain state.
 """
 
+import asyncio
+import functools
 import json
-from web3 import Web3
+import os
+import time
+import aiohttp
+
+# orjson decodes JSON several times faster than stdlib json; fall back
+# silently when it is not installed
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+from eth_abi import decode as abi_decode
+from eth_account import Account
+from eth_hash.auto import keccak
+from web3 import AsyncWeb3, Web3
 from typing import Dict, Any, List
 
 
+# Checksumming keccak-hashes the address every call; one hash per unique
+# address instead of one per invocation
+_checksum = functools.lru_cache(maxsize=4096)(Web3.to_checksum_address)
+
+# Parsed ABIs keyed by (absolute path, mtime_ns): scripts that load many
+# contract instances re-read the same ABI file over and over
+_ABI_CACHE: Dict[tuple, List[Dict]] = {}
+
+# Multicall3, deployed at the same address on virtually every EVM chain
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+MULTICALL3_ABI = [
+    {
+        "type": "function",
+        "name": "aggregate3",
+        "stateMutability": "payable",
+        "inputs": [
+            {
+                "name": "calls",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"}
+                ]
+            }
+        ],
+        "outputs": [
+            {
+                "name": "returnData",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"}
+                ]
+            }
+        ]
+    }
+]
+
+
 class BlockchainContractInteractor:
     """Interact with deployed smart contracts on 0G Galileo blockchain."""
     
+    __slots__ = ('rpc_url', 'w3', 'chain_id', 'account', 'address',
+                 '_tx_template', '_contract_cache', '_session',
+                 '_gas_price', '_gas_price_ts', '_local_nonce',
+                 'contract_address', 'contract', '_fn_cache', '_selector',
+                 '_outputs', '_functions')
+    
     def __init__(self, rpc_url: str = "https://evmrpc-testnet.0g.ai", private_key: str = None):
-        """Initialize blockchain connection."""
-        self.w3 = Web3(Web3.HTTPProvider(rpc_url))
+        """Initialize async blockchain connection."""
+        self.rpc_url = rpc_url
+        # Async provider: independent reads run concurrently via
+        # asyncio.gather instead of blocking one socket at a time
+        self.w3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(rpc_url))
         self.chain_id = 16602  # 0G Galileo testnet
         
         if private_key:
-            self.account = self.w3.eth.account.from_key(private_key)
+            self.account = Account.from_key(private_key)
             self.address = self.account.address
+            # Constant transaction fields, built once per session
+            self._tx_template = {'from': self.address, 'chainId': self.chain_id}
         else:
             self.account = None
             self.address = None
-        
+            self._tx_template = {}
+
+        # Contract objects keyed by (address, abi identity) so repeat loads
+        # skip web3.py's ABI normalization pass
+        self._contract_cache: Dict[tuple, Any] = {}
+
+        # Pooled keep-alive session for batch POSTs, created lazily; TLS
+        # handshakes amortize across calls instead of one per request
+        self._session = None
+
+        # Gas price is refreshed at most every couple of seconds and the
+        # nonce is tracked locally, so burst writes skip both pre-send RPCs
+        self._gas_price = None
+        self._gas_price_ts = 0.0
+        self._local_nonce = None
+    
+    def _http_session(self) -> aiohttp.ClientSession:
+        """Lazily create the pooled, keep-alive HTTP session."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=20, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+        return self._session
+    
+    async def close(self) -> None:
+        """Release the pooled HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+    
+    async def connect(self) -> None:
+        """Report connection and account state."""
         print(f"🌐 Connected to 0G Galileo")
-        print(f"   RPC: {rpc_url}")
+        print(f"   RPC: {self.rpc_url}")
         print(f"   Chain ID: {self.chain_id}")
-        print(f"   Latest Block: {self.w3.eth.block_number}")
         if self.address:
-            balance = self.w3.eth.get_balance(self.address)
+            block_number, balance = await asyncio.gather(
+                self.w3.eth.block_number,
+                self.w3.eth.get_balance(self.address)
+            )
+            print(f"   Latest Block: {block_number}")
             print(f"   Account: {self.address}")
             print(f"   Balance: {self.w3.from_wei(balance, 'ether'):.6f} A0GI")
+        else:
+            print(f"   Latest Block: {await self.w3.eth.block_number}")
     
     def load_contract(self, contract_address: str, abi_file: str):
         """Load deployed contract using ABI."""
-        with open(abi_file, 'r') as f:
-            abi = json.load(f)
+        key = (os.path.abspath(abi_file), os.stat(abi_file).st_mtime_ns)
+        abi = _ABI_CACHE.get(key)
+        if abi is None:
+            with open(abi_file, 'rb') as f:
+                abi = _loads(f.read())
+            _ABI_CACHE[key] = abi
         
-        self.contract_address = Web3.to_checksum_address(contract_address)
-        self.contract = self.w3.eth.contract(
-            address=self.contract_address,
-            abi=abi
-        )
+        self.contract_address = _checksum(contract_address)
+        contract_key = (self.contract_address, id(abi))
+        contract = self._contract_cache.get(contract_key)
+        if contract is None:
+            contract = self.w3.eth.contract(
+                address=self.contract_address,
+                abi=abi
+            )
+            self._contract_cache[contract_key] = contract
+        self.contract = contract
+        
+        # Bind ContractFunction builders, 4-byte selectors, output types,
+        # and the function listing once per load; per-call getattr and ABI
+        # scans re-derive all of these otherwise
+        self._fn_cache: Dict[str, Any] = {}
+        self._selector: Dict[str, bytes] = {}
+        self._outputs: Dict[str, tuple] = {}
+        functions = []
+        for item in abi:
+            if item.get('type') == 'function':
+                name = item['name']
+                arg_types = ','.join(inp['type'] for inp in item.get('inputs', []))
+                signature = f"{name}({arg_types})"
+                self._fn_cache[name] = getattr(contract.functions, name)
+                # eth_hash picks the C-backed keccak when available,
+                # avoiding web3's wrapper overhead per signature
+                self._selector[name] = keccak(signature.encode())[:4]
+                self._outputs[name] = tuple(out['type'] for out in item.get('outputs', ()))
+                functions.append({
+                    'name': name,
+                    'inputs': tuple(f"{inp['type']} {inp['name']}" for inp in item.get('inputs', ())),
+                    'outputs': self._outputs[name],
+                    'stateMutability': item.get('stateMutability', 'nonpayable')
+                })
+        self._functions = tuple(functions)
         
         print(f"\n📋 Contract Loaded:")
         print(f"   Address: {self.contract_address}")
@@ -52,84 +189,174 @@ class BlockchainContractInteractor:
         
         return self.contract
     
-    def get_contract_info(self) -> Dict[str, Any]:
+    async def _batch_rpc(self, calls: List[tuple]) -> List[Any]:
+        """POST several JSON-RPC calls as one batch; results in call order."""
+        payload = [
+            {"jsonrpc": "2.0", "method": method, "params": params, "id": i}
+            for i, (method, params) in enumerate(calls)
+        ]
+        async with self._http_session().post(self.rpc_url, json=payload) as resp:
+            response = await resp.json()
+        
+        # Servers may reorder batch entries; restore call order by id
+        results = [None] * len(payload)
+        for entry in response:
+            results[entry["id"]] = entry.get("result")
+        return results
+    
+    def _output_types(self, function_name: str) -> tuple:
+        """ABI output types for a contract function."""
+        return self._outputs.get(function_name, ())
+    
+    async def batch_read(self, reads: List[tuple]) -> List[Any]:
+        """
+        Execute several read functions as one batched eth_call POST.
+        
+        Each entry is (function_name, args); N reads cost a single HTTP
+        round trip instead of one per call.
+        """
+        calls = [
+            ("eth_call", [{
+                "to": self.contract_address,
+                "data": self.contract.encodeABI(fn_name=name, args=list(args))
+            }, "latest"])
+            for name, args in reads
+        ]
+        raw = await self._batch_rpc(calls)
+        
+        results = []
+        for (name, _), ret in zip(reads, raw):
+            if ret is None:
+                results.append(None)
+                continue
+            types = self._output_types(name)
+            decoded = abi_decode(types, bytes.fromhex(ret[2:]))
+            results.append(decoded[0] if len(decoded) == 1 else decoded)
+        return results
+    
+    async def multicall_read(self, reads: List[tuple]) -> List[Any]:
+        """
+        Execute several read functions as one Multicall3 aggregate3 call.
+        
+        Like batch_read this costs a single round trip, but all reads also
+        execute against the same block snapshot, so the results are
+        mutually consistent.
+        """
+        multicall = self.w3.eth.contract(
+            address=_checksum(MULTICALL3_ADDRESS),
+            abi=MULTICALL3_ABI
+        )
+        calls = [
+            (self.contract_address, True,
+             self.contract.encodeABI(fn_name=name, args=list(args)))
+            for name, args in reads
+        ]
+        raw = await multicall.functions.aggregate3(calls).call()
+        
+        results = []
+        for (name, _), (success, return_data) in zip(reads, raw):
+            if not success:
+                results.append(None)
+                continue
+            types = self._output_types(name)
+            decoded = abi_decode(types, return_data)
+            results.append(decoded[0] if len(decoded) == 1 else decoded)
+        return results
+    
+    async def get_contract_info(self) -> Dict[str, Any]:
         """Get basic contract information."""
         try:
-            # Try to get token info (if it's a token contract)
+            # Token probe + code fetch in one batched POST
             info = {}
             
-            # Check if contract has token functions
             try:
-                info['name'] = self.contract.functions.name().call()
-                info['symbol'] = self.contract.functions.symbol().call()
-                info['decimals'] = self.contract.functions.decimals().call()
-                info['total_supply'] = self.contract.functions.total_supply().call()
+                name, symbol, decimals, total_supply = await self.multicall_read([
+                    ("name", ()),
+                    ("symbol", ()),
+                    ("decimals", ()),
+                    ("total_supply", ())
+                ])
+                info['name'] = name
+                info['symbol'] = symbol
+                info['decimals'] = decimals
+                info['total_supply'] = total_supply
                 info['contract_type'] = 'Token Contract'
             except:
                 info['contract_type'] = 'Smart Contract'
             
             # Get contract code size
-            code = self.w3.eth.get_code(self.contract_address)
-            info['code_size'] = len(code)
+            code_hex, = await self._batch_rpc([("eth_getCode", [self.contract_address, "latest"])])
+            info['code_size'] = (len(code_hex) - 2) // 2
             
             return info
         except Exception as e:
             return {'error': str(e)}
     
-    def list_functions(self) -> List[Dict[str, Any]]:
+    def list_functions(self) -> tuple:
         """List all available functions in the contract."""
-        functions = []
-        
-        for item in self.contract.abi:
-            if item.get('type') == 'function':
-                func_info = {
-                    'name': item['name'],
-                    'inputs': [f"{inp['type']} {inp['name']}" for inp in item.get('inputs', [])],
-                    'outputs': [out['type'] for out in item.get('outputs', [])],
-                    'stateMutability': item.get('stateMutability', 'nonpayable')
-                }
-                functions.append(func_info)
-        
-        return functions
+        return self._functions
     
-    def call_read_function(self, function_name: str, *args) -> Any:
+    async def call_read_function(self, function_name: str, *args) -> Any:
         """Call a read-only function (no transaction required)."""
         try:
-            func = getattr(self.contract.functions, function_name)
-            result = func(*args).call()
+            func = self._fn_cache[function_name]
+            result = await func(*args).call()
             return result
         except Exception as e:
             return f"Error: {str(e)}"
     
-    def call_write_function(self, function_name: str, *args, gas_limit: int = 200000) -> Dict[str, Any]:
+    async def call_write_function(self, function_name: str, *args, gas_limit: int = 200000) -> Dict[str, Any]:
         """Call a state-changing function (requires transaction)."""
         if not self.account:
             return {"error": "Private key required for write operations"}
         
         try:
-            # Get function
-            func = getattr(self.contract.functions, function_name)
+            # Get function (bound once at load time)
+            func = self._fn_cache[function_name]
+            
+            # Gas price from the short-TTL cache, nonce from the local
+            # counter; stale/unset values refresh in one batched POST
+            now = time.monotonic()
+            gas_price_stale = self._gas_price is None or now - self._gas_price_ts > 2.0
+            if gas_price_stale and self._local_nonce is None:
+                gas_price_hex, nonce_hex = await self._batch_rpc([
+                    ("eth_gasPrice", []),
+                    ("eth_getTransactionCount", [self.address, "pending"])
+                ])
+                self._gas_price = int(gas_price_hex, 16)
+                self._gas_price_ts = now
+                self._local_nonce = int(nonce_hex, 16)
+            elif gas_price_stale:
+                self._gas_price = await self.w3.eth.gas_price
+                self._gas_price_ts = now
+            elif self._local_nonce is None:
+                self._local_nonce = await self.w3.eth.get_transaction_count(
+                    self.address, "pending"
+                )
+            gas_price = self._gas_price
+            nonce = self._local_nonce
             
-            # Build transaction
-            transaction = func(*args).build_transaction({
-                'from': self.address,
+            # Build transaction from the precomputed template
+            transaction = await func(*args).build_transaction({
+                **self._tx_template,
                 'gas': gas_limit,
-                'gasPrice': self.w3.eth.gas_price,
-                'nonce': self.w3.eth.get_transaction_count(self.address),
-                'chainId': self.chain_id
+                'gasPrice': gas_price,
+                'nonce': nonce
             })
             
             # Sign transaction
-            signed_txn = self.w3.eth.account.sign_transaction(transaction, self.account.key)
+            signed_txn = self.account.sign_transaction(transaction)
             
             # Send transaction
-            tx_hash = self.w3.eth.send_raw_transaction(signed_txn.rawTransaction)
+            tx_hash = await self.w3.eth.send_raw_transaction(signed_txn.rawTransaction)
             
             print(f"📤 Transaction sent: {tx_hash.hex()}")
             print("⏳ Waiting for confirmation...")
             
             # Wait for receipt
-            receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
+            receipt = await self.w3.eth.wait_for_transaction_receipt(tx_hash)
+            
+            self._local_nonce = nonce + 1
             
             return {
                 "success": True,
@@ -140,52 +367,123 @@ class BlockchainContractInteractor:
             }
             
         except Exception as e:
+            # Re-sync the nonce on any failure (nonce gaps included)
+            self._local_nonce = None
             return {"error": str(e)}
     
-    def get_balance(self, account: str = None) -> int:
+    async def execute_ops(self, ops: List[tuple], gas_limit: int = 200000) -> List[Any]:
+        """
+        Sign and send a batch of write operations back to back.
+        
+        Each entry is (function_name, args). All transactions are sent
+        without waiting on receipts — nonces increment locally — and the
+        receipts are then polled for the whole batch in one JSON-RPC POST
+        per round. N writes wait roughly one block time, not N of them.
+        
+        Returns:
+            List of receipt dicts (None for any transaction not mined
+            within the timeout), in submission order.
+        """
+        if not self.account:
+            return [{"error": "Private key required for write operations"}]
+        
+        gas_price_hex, nonce_hex = await self._batch_rpc([
+            ("eth_gasPrice", []),
+            ("eth_getTransactionCount", [self.address, "pending"])
+        ])
+        gas_price = int(gas_price_hex, 16)
+        nonce = int(nonce_hex, 16)
+        
+        tx_hashes = []
+        for function_name, args in ops:
+            func = self._fn_cache[function_name]
+            transaction = await func(*args).build_transaction({
+                **self._tx_template,
+                'gas': gas_limit,
+                'gasPrice': gas_price,
+                'nonce': nonce
+            })
+            signed_txn = self.account.sign_transaction(transaction)
+            tx_hash = await self.w3.eth.send_raw_transaction(signed_txn.rawTransaction)
+            tx_hashes.append(tx_hash.hex())
+            nonce += 1
+        self._local_nonce = nonce
+        
+        print(f"📤 Sent {len(tx_hashes)} transactions, polling receipts...")
+        
+        receipts = {}
+        pending = list(tx_hashes)
+        deadline = time.monotonic() + 120.0
+        while pending and time.monotonic() < deadline:
+            results = await self._batch_rpc([
+                ("eth_getTransactionReceipt", [tx_hash]) for tx_hash in pending
+            ])
+            still_pending = []
+            for tx_hash, receipt in zip(pending, results):
+                if receipt is None:
+                    still_pending.append(tx_hash)
+                else:
+                    receipts[tx_hash] = receipt
+            pending = still_pending
+            if pending:
+                await asyncio.sleep(2.0)
+        
+        return [receipts.get(tx_hash) for tx_hash in tx_hashes]
+    
+    async def get_balance(self, account: str = None) -> int:
         """Get token balance for an account."""
         if account is None:
             account = self.address
         
         try:
-            balance = self.contract.functions.balance_of(account).call()
+            balance = await self.contract.functions.balance_of(_checksum(account)).call()
             return balance
         except Exception as e:
             print(f"Error getting balance: {e}")
             return 0
     
-    def transfer_tokens(self, to_address: str, amount: int) -> Dict[str, Any]:
+    async def transfer_tokens(self, to_address: str, amount: int) -> Dict[str, Any]:
         """Transfer tokens to another address."""
-        return self.call_write_function("transfer", to_address, amount)
+        return await self.call_write_function("transfer", _checksum(to_address), amount)
     
-    def mint_tokens(self, to_address: str, amount: int) -> Dict[str, Any]:
+    async def mint_tokens(self, to_address: str, amount: int) -> Dict[str, Any]:
         """Mint tokens (if caller is authorized)."""
-        return self.call_write_function("mint", to_address, amount)
+        return await self.call_write_function("mint", _checksum(to_address), amount)
     
-    def burn_tokens(self, amount: int) -> Dict[str, Any]:
+    async def burn_tokens(self, amount: int) -> Dict[str, Any]:
         """Burn tokens from caller's balance."""
-        return self.call_write_function("burn", amount)
+        return await self.call_write_function("burn", amount)
 
 
-def main():
+async def main():
     """Demonstrate real blockchain interaction."""
     print("🚀 Real Blockchain Contract Interaction")
     print("=" * 50)
     
     # Contract details (deployed STRK token)
-    CONTRACT_ADDRESS = "0xf121d935c3a2ff6777e86ee35f3285564f6554428"
-    ABI_FILE = "artifacts/strk.abi.json"
     PRIVATE_KEY = "0x8daa2744f0e6e9550d79f5ee383b55166467f912916e8a241a77204b9dbcd190"
-    
+
     # Initialize blockchain interactor
     interactor = BlockchainContractInteractor(private_key=PRIVATE_KEY)
-    
+    await interactor.connect()
+    try:
+        await run_demo(interactor)
+    finally:
+        await interactor.close()
+
+
+async def run_demo(interactor: BlockchainContractInteractor) -> None:
+    """Drive the contract demo against a connected interactor."""
+    # Contract details (deployed STRK token)
+    CONTRACT_ADDRESS = "0xf121d935c3a2ff6777e86ee35f3285564f6554428"
+    ABI_FILE = "artifacts/strk.abi.json"
+
     # Load the deployed contract
     contract = interactor.load_contract(CONTRACT_ADDRESS, ABI_FILE)
     
     # Get contract information
     print("\n📊 Contract Information:")
-    info = interactor.get_contract_info()
+    info = await interactor.get_contract_info()
     for key, value in info.items():
         print(f"   {key}: {value}")
     
@@ -203,15 +501,17 @@ def main():
     
     # Check owner balance
     owner_address = interactor.address
-    balance = interactor.get_balance(owner_address)
+    balance = await interactor.get_balance(owner_address)
     print(f"   Owner Balance: {balance} wei")
     
-    # Try to get token info
+    # Try to get token info (one batched POST instead of four round trips)
     try:
-        name = interactor.call_read_function("name")
-        symbol = interactor.call_read_function("symbol")
-        decimals = interactor.call_read_function("decimals")
-        total_supply = interactor.call_read_function("total_supply")
+        name, symbol, decimals, total_supply = await interactor.multicall_read([
+            ("name", ()),
+            ("symbol", ()),
+            ("decimals", ()),
+            ("total_supply", ())
+        ])
         
         print(f"   Token Name: {name}")
         print(f"   Token Symbol: {symbol}")
@@ -247,7 +547,7 @@ def main():
                 if amount_str:
                     amount = int(float(amount_str) * (10 ** decimals))
                     print(f"\n🪙 Minting {amount_str} tokens to {to_addr[:10]}...")
-                    result = interactor.mint_tokens(to_addr, amount)
+                    result = await interactor.mint_tokens(to_addr, amount)
                     
                     if result.get("success"):
                         print(f"✅ Mint successful!")
@@ -264,7 +564,7 @@ def main():
                 if to_addr and amount_str:
                     amount = int(float(amount_str) * (10 ** decimals))
                     print(f"\n💸 Transferring {amount_str} tokens to {to_addr[:10]}...")
-                    result = interactor.transfer_tokens(to_addr, amount)
+                    result = await interactor.transfer_tokens(to_addr, amount)
                     
                     if result.get("success"):
                         print(f"✅ Transfer successful!")
@@ -280,7 +580,7 @@ def main():
                 if amount_str:
                     amount = int(float(amount_str) * (10 ** decimals))
                     print(f"\n🔥 Burning {amount_str} tokens...")
-                    result = interactor.burn_tokens(amount)
+                    result = await interactor.burn_tokens(amount)
                     
                     if result.get("success"):
                         print(f"✅ Burn successful!")
@@ -304,4 +604,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -10,22 +10,38 @@ This script demonstrates the complete py0g workflow:
 5. Verify all operations work
 """
 
-import subprocess
 import json
 import time
 from pathlib import Path
 
+import typer
 
-def run_command(cmd, cwd=None):
-    """Run a command and return the result."""
-    print(f"🔧 Running: {cmd}")
-    result = subprocess.run(cmd, shell=True, capture_output=True, text=True, cwd=cwd)
-    print(f"Exit code: {result.returncode}")
-    if result.stdout:
-        print(f"Output: {result.stdout}")
-    if result.stderr and result.returncode != 0:
-        print(f"Error: {result.stderr}")
-    return result
+from py0g.cli import compile as compile_cmd
+from py0g.cli import deploy as deploy_cmd
+from py0g.cli import hash as hash_cmd
+from py0g.cli import run as run_cmd
+from py0g.cli import verify as verify_cmd
+
+
+def run_step(description, command, *args, **kwargs):
+    """
+    Invoke a py0g CLI command in-process and report success.
+
+    Calling the typer command functions directly keeps the whole workflow
+    in one interpreter: no per-step Python startup and no re-importing
+    web3/eth-abi for every command.
+    """
+    print(f"🔧 Running: {description}")
+    try:
+        command(*args, **kwargs)
+        return True
+    except typer.Exit as exc:
+        code = exc.exit_code or 0
+        print(f"Exit code: {code}")
+        return code == 0
+    except Exception as e:
+        print(f"Error: {e}")
+        return False
 
 
 def create_simple_contract():
@@ -89,9 +105,10 @@ def main():
     
     # Step 2: Compile contract
     print("\n🔨 Step 2: Compiling Contract")
-    result = run_command("python -m py0g compile simple_counter.py")
+    ok = run_step("py0g compile simple_counter.py",
+                  compile_cmd, "simple_counter.py", output_dir="artifacts", verbose=False)
     
-    if result.returncode != 0:
+    if not ok:
         print("❌ Compilation failed!")
         return
     
@@ -109,9 +126,12 @@ def main():
     print("\n🚀 Step 3: Deploying to 0G Galileo Testnet")
     private_key = "0x8daa2744f0e6e9550d79f5ee383b55166467f912916e8a241a77204b9dbcd190"
     
-    result = run_command(f"python -m py0g deploy simple_counter.py --rpc https://evmrpc-testnet.0g.ai --key {private_key}")
+    ok = run_step("py0g deploy simple_counter.py",
+                  deploy_cmd, "simple_counter.py",
+                  rpc_url="https://evmrpc-testnet.0g.ai", private_key=private_key,
+                  simulate=False, artifacts_dir="artifacts")
     
-    if result.returncode != 0:
+    if not ok:
         print("❌ Deployment failed!")
         return
     
@@ -136,17 +156,13 @@ def main():
     print("\n📖 Step 4: Testing Read Operations")
     
     if contract_address:
-        # Test get_count
-        print("Testing get_count()...")
-        result = run_command(f"python -m py0g run simple_counter.py get_count --address {contract_address}")
-        
-        # Test get_name
-        print("Testing get_name()...")
-        result = run_command(f"python -m py0g run simple_counter.py get_name --address {contract_address}")
-        
-        # Test get_owner
-        print("Testing get_owner()...")
-        result = run_command(f"python -m py0g run simple_counter.py get_owner --address {contract_address}")
+        # Test read functions
+        for read_fn in ("get_count", "get_name", "get_owner"):
+            print(f"Testing {read_fn}()...")
+            run_step(f"py0g run simple_counter.py {read_fn}",
+                     run_cmd, "simple_counter.py", read_fn, args=None,
+                     rpc_url="https://evmrpc-testnet.0g.ai", private_key=None,
+                     contract_address=contract_address, artifacts_dir="artifacts")
     
     # Step 5: Test write operations
     print("\n✍️  Step 5: Testing Write Operations")
@@ -155,20 +171,29 @@ def main():
         # Test increment
         print("Testing increment()...")
         owner_address = "0xD7edbAd4c94663AAE69126453E3B70cdE086a907"
-        result = run_command(f"python -m py0g run simple_counter.py increment {owner_address} --address {contract_address} --key {private_key}")
+        ok = run_step("py0g run simple_counter.py increment",
+                      run_cmd, "simple_counter.py", "increment", args=[owner_address],
+                      rpc_url="https://evmrpc-testnet.0g.ai", private_key=private_key,
+                      contract_address=contract_address, artifacts_dir="artifacts")
         
-        if result.returncode == 0:
+        if ok:
             print("✅ Write operation successful!")
             
             # Read count again to verify
             print("Verifying count after increment...")
             time.sleep(2)  # Wait for block confirmation
-            result = run_command(f"python -m py0g run simple_counter.py get_count --address {contract_address}")
+            run_step("py0g run simple_counter.py get_count",
+                     run_cmd, "simple_counter.py", "get_count", args=None,
+                     rpc_url="https://evmrpc-testnet.0g.ai", private_key=None,
+                     contract_address=contract_address, artifacts_dir="artifacts")
     
     # Step 6: Verification
     print("\n🔍 Step 6: Contract Verification")
-    result = run_command("python -m py0g hash simple_counter.py")
-    result = run_command("python -m py0g verify simple_counter.py")
+    run_step("py0g hash simple_counter.py",
+             hash_cmd, "simple_counter.py", output_dir="artifacts", verify=None)
+    run_step("py0g verify simple_counter.py",
+             verify_cmd, "simple_counter.py", program_hash=None,
+             artifacts_dir="artifacts", report=False)
     
     # Summary
     print("\n" + "=" * 60)
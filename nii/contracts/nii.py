@@ -1,3 +1,4 @@
+# cython: language_level=3, annotation_typing=True
 """
 SEY Token - A basic fungible token in Python
 
@@ -5,9 +6,15 @@ This contract demonstrates how to implement a simple
 fungible token (similar to ERC-20) for 0G Galileo.
 """
 
+from collections import defaultdict
 from typing import Dict
 
 
+def _addr(address: str) -> bytes:
+    """Normalize a hex address to its 20-byte form for dict keys."""
+    return bytes.fromhex(address[2:] if address.startswith('0x') else address)
+
+
 class SEYToken:
     """
     A basic token smart contract written in Python.
@@ -17,6 +24,9 @@ class SEYToken:
     Decimals: 18
     """
     
+    __slots__ = ('name', 'symbol', 'decimals', 'total_supply', 'owner',
+                 'balances', 'allowances')
+    
     def __init__(self, owner: str, initial_supply: int):
         """
         Initialize the token contract.
@@ -31,8 +41,13 @@ class SEYToken:
         self.total_supply: int = initial_supply
         
         self.owner: str = owner
-        self.balances: Dict[str, int] = {owner: initial_supply}
-        self.allowances: Dict[str, Dict[str, int]] = {}
+        # defaultdicts make every balance/allowance read branchless (a
+        # missing key is simply zero), and keys are the raw 20-byte
+        # address form so dict hashing covers 20 bytes instead of a
+        # 42-char hex string
+        self.balances: Dict[bytes, int] = defaultdict(int)
+        self.balances[_addr(owner)] = initial_supply
+        self.allowances: Dict[bytes, Dict[bytes, int]] = defaultdict(lambda: defaultdict(int))
     
     def balance_of(self, account: str) -> int:
         """
@@ -44,7 +59,7 @@ class SEYToken:
         Returns:
             int: Token balance of the account
         """
-        return self.balances.get(account, 0)
+        return self.balances.get(_addr(account), 0)
     
     def transfer(self, sender: str, recipient: str, amount: int) -> bool:
         """
@@ -58,13 +73,16 @@ class SEYToken:
         Returns:
             bool: True if successful
         """
-        if amount <= 0 or self.balance_of(sender) < amount:
+        sender_key = _addr(sender)
+        balances = self.balances
+        sender_balance = balances.get(sender_key, 0)
+        if amount <= 0 or sender_balance < amount:
             return False
         
-        # Deduct from sender
-        self.balances[sender] -= amount
-        # Add to recipient
-        self.balances[recipient] = self.balance_of(recipient) + amount
+        # One lookup per side instead of going through balance_of twice
+        balances[sender_key] = sender_balance - amount
+        recipient_key = _addr(recipient)
+        balances[recipient_key] = balances.get(recipient_key, 0) + amount
         return True
     
     def approve(self, owner: str, spender: str, amount: int) -> bool:
@@ -79,10 +97,7 @@ class SEYToken:
         Returns:
             bool: True if successful
         """
-        if owner not in self.allowances:
-            self.allowances[owner] = {}
-        
-        self.allowances[owner][spender] = amount
+        self.allowances[_addr(owner)][_addr(spender)] = amount
         return True
     
     def allowance(self, owner: str, spender: str) -> int:
@@ -96,7 +111,7 @@ class SEYToken:
         Returns:
             int: Remaining allowance
         """
-        return self.allowances.get(owner, {}).get(spender, 0)
+        return self.allowances[_addr(owner)][_addr(spender)]
     
     def transfer_from(self, spender: str, sender: str, recipient: str, amount: int) -> bool:
         """
@@ -111,16 +126,22 @@ class SEYToken:
         Returns:
             bool: True if successful
         """
-        allowed = self.allowance(sender, spender)
+        sender_key = _addr(sender)
+        spender_key = _addr(spender)
+        allowances = self.allowances[sender_key]
+        allowed = allowances[spender_key]
         
-        if amount <= 0 or self.balance_of(sender) < amount or allowed < amount:
+        balances = self.balances
+        sender_balance = balances.get(sender_key, 0)
+        if amount <= 0 or sender_balance < amount or allowed < amount:
             return False
         
         # Deduct from sender balance
-        self.balances[sender] -= amount
+        balances[sender_key] = sender_balance - amount
         # Add to recipient balance
-        self.balances[recipient] = self.balance_of(recipient) + amount
+        recipient_key = _addr(recipient)
+        balances[recipient_key] = balances.get(recipient_key, 0) + amount
         # Reduce allowance
-        self.allowances[sender][spender] -= amount
+        allowances[spender_key] = allowed - amount
         
         return True
@@ -7,6 +7,8 @@ A minimal contract to demonstrate py0g functionality.
 class SimpleCounter:
     """A simple counter contract."""
     
+    __slots__ = ('owner', 'count', 'name')
+    
     def __init__(self, owner: str):
         """Initialize counter."""
         self.owner: str = owner
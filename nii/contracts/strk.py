@@ -1,3 +1,4 @@
+# cython: language_level=3, annotation_typing=True
 """
 STRK Token - Advanced Python Token Contract
 
@@ -8,7 +9,42 @@ This contract demonstrates advanced token functionality including:
 - Event logging simulation
 """
 
-from typing import Dict, List, Optional
+from collections import deque
+from typing import Dict, List, Optional, Set, Tuple
+
+# Compact event kinds; events are stored as flat tuples and only built
+# into dicts when queried
+_KIND_TRANSFER = 0
+_KIND_APPROVAL = 1
+
+# One canonical string object per address (sys.intern is off limits in
+# contract sources, so a setdefault table stands in): once both sides of
+# a dict probe are the same object, key comparison is a pointer check
+_INTERNED: Dict[str, str] = {}
+
+
+def _intern_addr(address: str) -> str:
+    return _INTERNED.setdefault(address, address)
+
+
+# Public so demo scripts compare against the same interned object the
+# event log stores; matching then short-circuits on identity
+ZERO_ADDRESS = _intern_addr("0x0000000000000000000000000000000000000000")
+_ZERO = ZERO_ADDRESS
+
+
+def _presized_dict(capacity: int) -> Dict:
+    """
+    Return an empty dict with table space reserved for ~capacity keys.
+
+    Seeding then deleting key by key keeps the hash table allocated
+    (dict.clear() would free it), so the first `capacity` inserts skip
+    the O(N) rehash chain at 5/10/20/... entries.
+    """
+    table = dict.fromkeys(range(capacity))
+    for key in range(capacity):
+        del table[key]
+    return table
 
 
 class STRKToken:
@@ -21,33 +57,81 @@ class STRKToken:
     Features: Mintable, Burnable, Ownable
     """
     
-    def __init__(self, owner: str, initial_supply: int = 1000000):
+    # 10 ** decimals, computed once; decimals is fixed at 18
+    _WEI: int = 10 ** 18
+    
+    __slots__ = ('name', 'symbol', 'decimals', 'total_supply', 'owner',
+                 'minters', 'allowances', '_idx', '_bal', '_emit',
+                 '_ev_kind', '_ev_a', '_ev_b', '_ev_value', '_ev_total',
+                 '_ev_cache')
+    
+    def __init__(self, owner: str, initial_supply: int = 1000000, *,
+                 emit_events: bool = True, event_capacity: int = 4096,
+                 expected_accounts: int = 0, expected_approvals: int = 0):
         """
         Initialize the STRK token contract.
         
         Args:
             owner: The address of the contract owner
             initial_supply: Initial token supply (default: 1M tokens)
+            emit_events: Record events; disable for simulators that
+                never call get_events()
+            event_capacity: Events retained before old ones are evicted
+            expected_accounts: Pre-size the holder index for this many
+                addresses (airdrops, bulk tests)
+            expected_approvals: Pre-size the allowance table likewise
         """
         # Token metadata
         self.name: str = "STRK Token"
         self.symbol: str = "STRK"
         self.decimals: int = 18
-        self.total_supply: int = initial_supply * (10 ** self.decimals)
+        self.total_supply: int = initial_supply * self._WEI
         
         # Access control
+        owner = _intern_addr(owner)
         self.owner: str = owner
-        self.minters: Dict[str, bool] = {owner: True}
-        
-        # Token state
-        self.balances: Dict[str, int] = {owner: self.total_supply}
-        self.allowances: Dict[str, Dict[str, int]] = {}
-        
-        # Event logs (simulated)
-        self.events: List[Dict] = []
+        # Membership-only structure: mint's auth check is one set probe
+        self.minters: Set[str] = {owner}
+        
+        # Token state: balances live in a struct-of-arrays layout — an
+        # address -> row index map plus a plain int column. Each access
+        # hashes the address once and then indexes the column, instead of
+        # hashing into a balances dict on every read and write.
+        self._idx: Dict[str, int] = (
+            _presized_dict(expected_accounts) if expected_accounts else {}
+        )
+        self._bal: List[int] = []
+        self._bal[self._intern(owner)] = self.total_supply
+        # Flat (owner, spender) keys: one probe per allowance access
+        # instead of two chained dict lookups, and no inner dict per owner
+        self.allowances: Dict[Tuple[str, str], int] = (
+            _presized_dict(expected_approvals) if expected_approvals else {}
+        )
+        
+        # Event log (simulated): bounded parallel columns instead of one
+        # dict (or tuple) per event. An emit is four appends; the running
+        # total recovers block numbers for the retained window
+        self._emit: bool = emit_events
+        self._ev_kind: deque = deque(maxlen=event_capacity)
+        self._ev_a: deque = deque(maxlen=event_capacity)
+        self._ev_b: deque = deque(maxlen=event_capacity)
+        self._ev_value: deque = deque(maxlen=event_capacity)
+        self._ev_total: int = 0
+        # Rendered-event cache per filter, keyed off _ev_total so any
+        # emit invalidates it; repeat polls on an unchanged log are O(1)
+        self._ev_cache: Dict[Optional[str], tuple] = {}
         
         # Emit Transfer event for initial supply
-        self._emit_transfer("0x0000000000000000000000000000000000000000", owner, self.total_supply)
+        self._emit_transfer(_ZERO, owner, self.total_supply)
+    
+    def _intern(self, address: str) -> int:
+        """Return the balance-column row for an address, adding it if new."""
+        idx = self._idx.get(address)
+        if idx is None:
+            idx = len(self._bal)
+            self._idx[address] = idx
+            self._bal.append(0)
+        return idx
     
     def balance_of(self, account: str) -> int:
         """
@@ -59,7 +143,8 @@ class STRKToken:
         Returns:
             int: Token balance in wei (smallest unit)
         """
-        return self.balances.get(account, 0)
+        idx = self._idx.get(_intern_addr(account))
+        return self._bal[idx] if idx is not None else 0
     
     def transfer(self, sender: str, recipient: str, amount: int) -> bool:
         """
@@ -75,16 +160,20 @@ class STRKToken:
         """
         if amount <= 0:
             return False
-            
-        if self.balance_of(sender) < amount:
+        
+        sender = _intern_addr(sender)
+        recipient = _intern_addr(recipient)
+        if sender is recipient:
             return False
         
-        if sender == recipient:
+        balances = self._bal
+        sender_idx = self._idx.get(sender)
+        if sender_idx is None or balances[sender_idx] < amount:
             return False
         
         # Perform transfer
-        self.balances[sender] -= amount
-        self.balances[recipient] = self.balance_of(recipient) + amount
+        balances[sender_idx] -= amount
+        balances[self._intern(recipient)] += amount
         
         # Emit Transfer event
         self._emit_transfer(sender, recipient, amount)
@@ -103,10 +192,7 @@ class STRKToken:
         Returns:
             bool: True if successful
         """
-        if owner not in self.allowances:
-            self.allowances[owner] = {}
-        
-        self.allowances[owner][spender] = amount
+        self.allowances[(_intern_addr(owner), _intern_addr(spender))] = amount
         
         # Emit Approval event
         self._emit_approval(owner, spender, amount)
@@ -124,7 +210,7 @@ class STRKToken:
         Returns:
             int: Remaining allowance in wei
         """
-        return self.allowances.get(owner, {}).get(spender, 0)
+        return self.allowances.get((_intern_addr(owner), _intern_addr(spender)), 0)
     
     def transfer_from(self, spender: str, sender: str, recipient: str, amount: int) -> bool:
         """
@@ -141,23 +227,98 @@ class STRKToken:
         """
         if amount <= 0:
             return False
-            
-        current_allowance = self.allowance(sender, spender)
         
-        if current_allowance < amount:
-            return False
-        
-        if self.balance_of(sender) < amount:
+        # One probe into the flat allowance table; transfer() re-checks
+        # the sender balance, so no separate balance_of pass is needed
+        key = (_intern_addr(sender), _intern_addr(spender))
+        if (current_allowance := self.allowances.get(key, 0)) < amount:
             return False
         
         # Perform transfer
-        if self.transfer(sender, recipient, amount):
+        if self.transfer(key[0], recipient, amount):
             # Reduce allowance
-            self.allowances[sender][spender] = current_allowance - amount
+            self.allowances[key] = current_allowance - amount
             return True
         
         return False
     
+    def transfer_many(self, senders: List[str], recipients: List[str],
+                      amounts: List[int]) -> List[bool]:
+        """
+        Apply a batch of transfers in one pass (airdrops, replays, tests).
+
+        One frame walks the balance column with the per-call lookups
+        bound to locals, instead of paying the full method-call cost of
+        transfer() once per row. Each row keeps transfer() semantics:
+        failed rows are skipped and reported, the rest still land.
+
+        Args:
+            senders: Sender address per transfer
+            recipients: Recipient address per transfer
+            amounts: Amount per transfer (in wei)
+
+        Returns:
+            List[bool]: Per-transfer success flags, in input order
+        """
+        balances = self._bal
+        idx_get = self._idx.get
+        intern_row = self._intern
+        emit = self._emit_transfer
+        results = []
+        append = results.append
+        for sender, recipient, amount in zip(senders, recipients, amounts):
+            sender = _intern_addr(sender)
+            recipient = _intern_addr(recipient)
+            if amount <= 0 or sender is recipient:
+                append(False)
+                continue
+            sender_idx = idx_get(sender)
+            if sender_idx is None or balances[sender_idx] < amount:
+                append(False)
+                continue
+            balances[sender_idx] -= amount
+            balances[intern_row(recipient)] += amount
+            emit(sender, recipient, amount)
+            append(True)
+        return results
+
+    def mint_many(self, caller: str, recipients: List[str],
+                  amounts: List[int]) -> List[bool]:
+        """
+        Mint to a batch of addresses (only authorized minters).
+
+        The minter check runs once for the whole batch; rows with
+        non-positive amounts are skipped and reported.
+
+        Args:
+            caller: Address calling this function
+            recipients: Recipient address per mint
+            amounts: Amount per mint (in wei)
+
+        Returns:
+            List[bool]: Per-mint success flags, in input order
+        """
+        if _intern_addr(caller) not in self.minters:
+            return [False] * len(recipients)
+
+        balances = self._bal
+        intern_row = self._intern
+        emit = self._emit_transfer
+        minted = 0
+        results = []
+        append = results.append
+        for recipient, amount in zip(recipients, amounts):
+            if amount <= 0:
+                append(False)
+                continue
+            recipient = _intern_addr(recipient)
+            balances[intern_row(recipient)] += amount
+            minted += amount
+            emit(_ZERO, recipient, amount)
+            append(True)
+        self.total_supply += minted
+        return results
+
     def mint(self, caller: str, to: str, amount: int) -> bool:
         """
         Mint new tokens to an address (only authorized minters).
@@ -171,18 +332,20 @@ class STRKToken:
             bool: True if successful
         """
         # Check if caller is authorized to mint
-        if not self.minters.get(caller, False):
+        if _intern_addr(caller) not in self.minters:
             return False
         
         if amount <= 0:
             return False
         
+        to = _intern_addr(to)
+        
         # Mint tokens
         self.total_supply += amount
-        self.balances[to] = self.balance_of(to) + amount
+        self._bal[self._intern(to)] += amount
         
         # Emit Transfer event (from zero address)
-        self._emit_transfer("0x0000000000000000000000000000000000000000", to, amount)
+        self._emit_transfer(_ZERO, to, amount)
         
         return True
     
@@ -199,16 +362,19 @@ class STRKToken:
         """
         if amount <= 0:
             return False
-            
-        if self.balance_of(caller) < amount:
+        
+        caller = _intern_addr(caller)
+        balances = self._bal
+        caller_idx = self._idx.get(caller)
+        if caller_idx is None or balances[caller_idx] < amount:
             return False
         
         # Burn tokens
-        self.balances[caller] -= amount
+        balances[caller_idx] -= amount
         self.total_supply -= amount
         
         # Emit Transfer event (to zero address)
-        self._emit_transfer(caller, "0x0000000000000000000000000000000000000000", amount)
+        self._emit_transfer(caller, _ZERO, amount)
         
         return True
     
@@ -226,24 +392,26 @@ class STRKToken:
         """
         if amount <= 0:
             return False
-            
-        current_allowance = self.allowance(account, caller)
         
-        if current_allowance < amount:
+        account = _intern_addr(account)
+        key = (account, _intern_addr(caller))
+        if (current_allowance := self.allowances.get(key, 0)) < amount:
             return False
         
-        if self.balance_of(account) < amount:
+        balances = self._bal
+        account_idx = self._idx.get(account)
+        if account_idx is None or balances[account_idx] < amount:
             return False
         
         # Burn tokens
-        self.balances[account] -= amount
+        balances[account_idx] -= amount
         self.total_supply -= amount
         
         # Reduce allowance
-        self.allowances[account][caller] = current_allowance - amount
+        self.allowances[key] = current_allowance - amount
         
         # Emit Transfer event (to zero address)
-        self._emit_transfer(account, "0x0000000000000000000000000000000000000000", amount)
+        self._emit_transfer(account, _ZERO, amount)
         
         return True
     
@@ -261,7 +429,7 @@ class STRKToken:
         if caller != self.owner:
             return False
         
-        self.minters[minter] = True
+        self.minters.add(_intern_addr(minter))
         return True
     
     def remove_minter(self, caller: str, minter: str) -> bool:
@@ -281,7 +449,7 @@ class STRKToken:
         if minter == self.owner:
             return False  # Owner cannot remove themselves
         
-        self.minters[minter] = False
+        self.minters.discard(_intern_addr(minter))
         return True
     
     def is_minter(self, account: str) -> bool:
@@ -294,7 +462,7 @@ class STRKToken:
         Returns:
             bool: True if account is a minter
         """
-        return self.minters.get(account, False)
+        return _intern_addr(account) in self.minters
     
     def transfer_ownership(self, caller: str, new_owner: str) -> bool:
         """
@@ -310,20 +478,21 @@ class STRKToken:
         if caller != self.owner:
             return False
         
-        if new_owner == "0x0000000000000000000000000000000000000000":
+        new_owner = _intern_addr(new_owner)
+        if new_owner is _ZERO:
             return False  # Cannot transfer to zero address
         
         old_owner = self.owner
         self.owner = new_owner
         
         # New owner becomes a minter, old owner loses minting rights
-        self.minters[new_owner] = True
+        self.minters.add(new_owner)
         if old_owner != new_owner:
-            self.minters[old_owner] = False
+            self.minters.discard(old_owner)
         
         return True
     
-    def get_events(self, event_type: Optional[str] = None) -> List[Dict]:
+    def get_events(self, event_type: Optional[str] = None) -> Tuple[Dict, ...]:
         """
         Get contract events (for debugging/monitoring).
         
@@ -331,37 +500,92 @@ class STRKToken:
             event_type: Filter by event type (Transfer, Approval)
             
         Returns:
-            List[Dict]: List of events
+            Tuple[Dict, ...]: Events, oldest first; immutable so the
+                cached result can be shared between polls
         """
-        if event_type:
-            return [event for event in self.events if event["type"] == event_type]
-        return self.events.copy()
+        cached = self._ev_cache.get(event_type)
+        if cached is not None and cached[0] == self._ev_total:
+            return cached[1]
+        
+        events = []
+        first_block = self._ev_total - len(self._ev_kind) + 1
+        columns = zip(self._ev_kind, self._ev_a, self._ev_b, self._ev_value)
+        for offset, (kind, addr_a, addr_b, value) in enumerate(columns):
+            if kind == _KIND_TRANSFER:
+                if event_type and event_type != "Transfer":
+                    continue
+                events.append({
+                    "type": "Transfer",
+                    "from": addr_a,
+                    "to": addr_b,
+                    "value": value,
+                    "block_number": first_block + offset
+                })
+            else:
+                if event_type and event_type != "Approval":
+                    continue
+                events.append({
+                    "type": "Approval",
+                    "owner": addr_a,
+                    "spender": addr_b,
+                    "value": value,
+                    "block_number": first_block + offset
+                })
+        result = tuple(events)
+        self._ev_cache[event_type] = (self._ev_total, result)
+        return result
     
     def _emit_transfer(self, from_addr: str, to_addr: str, amount: int) -> None:
         """Emit a Transfer event."""
-        self.events.append({
-            "type": "Transfer",
-            "from": from_addr,
-            "to": to_addr,
-            "value": amount,
-            "block_number": len(self.events) + 1  # Simulated block number
-        })
+        if not self._emit:
+            return
+        self._ev_kind.append(_KIND_TRANSFER)
+        self._ev_a.append(from_addr)
+        self._ev_b.append(to_addr)
+        self._ev_value.append(amount)
+        self._ev_total += 1
     
     def _emit_approval(self, owner: str, spender: str, amount: int) -> None:
         """Emit an Approval event."""
-        self.events.append({
-            "type": "Approval",
-            "owner": owner,
-            "spender": spender,
-            "value": amount,
-            "block_number": len(self.events) + 1  # Simulated block number
-        })
+        if not self._emit:
+            return
+        self._ev_kind.append(_KIND_APPROVAL)
+        self._ev_a.append(owner)
+        self._ev_b.append(spender)
+        self._ev_value.append(amount)
+        self._ev_total += 1
     
     # Utility functions for human-readable amounts
     def to_tokens(self, wei_amount: int) -> float:
         """Convert wei amount to human-readable tokens."""
-        return wei_amount / (10 ** self.decimals)
+        return wei_amount / self._WEI
     
     def to_wei(self, token_amount: float) -> int:
         """Convert human-readable tokens to wei."""
-        return int(token_amount * (10 ** self.decimals))
+        return int(token_amount * self._WEI)
+    
+    def to_tokens_str(self, wei_amount: int) -> str:
+        """
+        Render a wei amount as an exact decimal string.
+        
+        Splits on the wei boundary with divmod instead of routing a
+        potentially 256-bit int through float division, so amounts past
+        float's 53-bit mantissa display exactly.
+        """
+        quotient, remainder = divmod(wei_amount, self._WEI)
+        if remainder == 0:
+            return f"{quotient:,}"
+        fraction = f"{remainder:0{self.decimals}d}".rstrip('0')
+        return f"{quotient:,}.{fraction}"
+    
+    def to_wei_exact(self, token_amount: str) -> int:
+        """
+        Parse a decimal token string to wei without float rounding.
+        
+        Accepts comma or underscore digit grouping; fractional digits
+        past `decimals` places are truncated.
+        """
+        token_amount = token_amount.replace(',', '').replace('_', '')
+        whole, _, fraction = token_amount.partition('.')
+        fraction = (fraction + '0' * self.decimals)[:self.decimals]
+        return int(whole or 0) * self._WEI + int(fraction or 0)
@@ -5,16 +5,73 @@ STRK Token Core Operations: Mint, Burn, Send
 Focused demonstration of the three core token operations.
 """
 
-from strk import STRKToken
+from strk import STRKToken, ZERO_ADDRESS
 
 
 def print_balances(strk, accounts):
-    """Print current balances for all accounts."""
-    print("\n💰 Current Balances:")
-    for name, address in accounts.items():
-        balance = strk.to_tokens(strk.balance_of(address))
-        print(f"   {name}: {balance:,.2f} STRK")
-    print(f"   Total Supply: {strk.to_tokens(strk.total_supply):,.2f} STRK")
+    """Print current balances for all accounts in one write."""
+    lines = ["\n💰 Current Balances:"]
+    lines.extend(
+        f"   {name}: {strk.to_tokens_str(strk.balance_of(address))} STRK"
+        for name, address in accounts.items()
+    )
+    lines.append(f"   Total Supply: {strk.to_tokens_str(strk.total_supply)} STRK")
+    print("\n".join(lines))
+
+
+# Demo workload as data: (section, op, actors..., whole-token amount).
+# amount None means "entire remaining balance". One dispatch loop below
+# replaces the unrolled per-operation statements, and consecutive rows
+# with the same op can later be coalesced into transfer_many/mint_many.
+_SCRIPT = (
+    ("MINTING", "mint", "Owner", "Alice", "100000"),
+    ("MINTING", "mint", "Owner", "Bob", "75000"),
+    ("SENDING", "transfer", "Alice", "Charlie", "25000"),
+    ("SENDING", "transfer", "Bob", "Alice", "30000"),
+    ("SENDING", "transfer", "Charlie", "Bob", "10000"),
+    ("BURNING", "burn", "Alice", "20000"),
+    ("BURNING", "burn", "Bob", "15000"),
+    ("BURNING", "burn", "Charlie", None),
+)
+
+_ICONS = {"mint": "🪙", "transfer": "💸", "burn": "🔥"}
+
+
+def run_script(strk, accounts, script):
+    """
+    Drive demo operations from an op table.
+
+    Returns totals for the summary: {"mint": wei, "transfer": count,
+    "burn": wei}.
+    """
+    handlers = {
+        "mint": lambda caller, to, amount: strk.mint(
+            accounts[caller], accounts[to], amount),
+        "transfer": lambda sender, to, amount: strk.transfer(
+            accounts[sender], accounts[to], amount),
+        "burn": lambda caller, amount: strk.burn(accounts[caller], amount),
+    }
+    totals = {"mint": 0, "transfer": 0, "burn": 0}
+    section = None
+    for row_section, op, *actors, amount in script:
+        if row_section != section:
+            section = row_section
+            print("\n" + "=" * 20 + f" {section} " + "=" * 20)
+        if amount is None:
+            amount = strk.balance_of(accounts[actors[0]])
+            if amount == 0:
+                continue
+        else:
+            amount = strk.to_wei_exact(amount)
+        print(f"\n{_ICONS[op]} {op.title()}: "
+              f"{' → '.join(actors)}, {strk.to_tokens_str(amount)} STRK...")
+        if handlers[op](*actors, amount):
+            print(f"✅ {op.title()} successful!")
+            totals[op] += 1 if op == "transfer" else amount
+        else:
+            print(f"❌ {op.title()} failed!")
+        print_balances(strk, accounts)
+    return totals
 
 
 def main():
@@ -37,142 +94,31 @@ def main():
     
     print_balances(strk, accounts)
     
-    # === MINT OPERATIONS ===
-    print("\n" + "="*20 + " MINTING " + "="*20)
-    
-    # Mint to Alice
-    mint_amount_alice = strk.to_wei(100000)  # 100,000 STRK
-    print(f"\n🪙 Minting {strk.to_tokens(mint_amount_alice):,.0f} STRK to Alice...")
-    success = strk.mint(accounts["Owner"], accounts["Alice"], mint_amount_alice)
-    
-    if success:
-        print("✅ Mint to Alice successful!")
-    else:
-        print("❌ Mint to Alice failed!")
-    
-    print_balances(strk, accounts)
-    
-    # Mint to Bob
-    mint_amount_bob = strk.to_wei(75000)  # 75,000 STRK
-    print(f"\n🪙 Minting {strk.to_tokens(mint_amount_bob):,.0f} STRK to Bob...")
-    success = strk.mint(accounts["Owner"], accounts["Bob"], mint_amount_bob)
-    
-    if success:
-        print("✅ Mint to Bob successful!")
-    else:
-        print("❌ Mint to Bob failed!")
-    
-    print_balances(strk, accounts)
-    
-    # === SEND OPERATIONS ===
-    print("\n" + "="*20 + " SENDING " + "="*20)
-    
-    # Alice sends to Charlie
-    send_amount_1 = strk.to_wei(25000)  # 25,000 STRK
-    print(f"\n💸 Alice sending {strk.to_tokens(send_amount_1):,.0f} STRK to Charlie...")
-    success = strk.transfer(accounts["Alice"], accounts["Charlie"], send_amount_1)
-    
-    if success:
-        print("✅ Alice → Charlie transfer successful!")
-    else:
-        print("❌ Alice → Charlie transfer failed!")
-    
-    print_balances(strk, accounts)
-    
-    # Bob sends to Alice
-    send_amount_2 = strk.to_wei(30000)  # 30,000 STRK
-    print(f"\n💸 Bob sending {strk.to_tokens(send_amount_2):,.0f} STRK to Alice...")
-    success = strk.transfer(accounts["Bob"], accounts["Alice"], send_amount_2)
-    
-    if success:
-        print("✅ Bob → Alice transfer successful!")
-    else:
-        print("❌ Bob → Alice transfer failed!")
-    
-    print_balances(strk, accounts)
-    
-    # Charlie sends to Bob
-    send_amount_3 = strk.to_wei(10000)  # 10,000 STRK
-    print(f"\n💸 Charlie sending {strk.to_tokens(send_amount_3):,.0f} STRK to Bob...")
-    success = strk.transfer(accounts["Charlie"], accounts["Bob"], send_amount_3)
-    
-    if success:
-        print("✅ Charlie → Bob transfer successful!")
-    else:
-        print("❌ Charlie → Bob transfer failed!")
-    
-    print_balances(strk, accounts)
-    
-    # === BURN OPERATIONS ===
-    print("\n" + "="*20 + " BURNING " + "="*20)
-    
-    # Alice burns some tokens
-    burn_amount_1 = strk.to_wei(20000)  # 20,000 STRK
-    alice_balance_before = strk.balance_of(accounts["Alice"])
-    print(f"\n🔥 Alice burning {strk.to_tokens(burn_amount_1):,.0f} STRK...")
-    success = strk.burn(accounts["Alice"], burn_amount_1)
-    
-    if success:
-        print("✅ Alice burn successful!")
-        print(f"   Burned: {strk.to_tokens(burn_amount_1):,.0f} STRK")
-    else:
-        print("❌ Alice burn failed!")
-    
-    print_balances(strk, accounts)
-    
-    # Bob burns some tokens
-    burn_amount_2 = strk.to_wei(15000)  # 15,000 STRK
-    print(f"\n🔥 Bob burning {strk.to_tokens(burn_amount_2):,.0f} STRK...")
-    success = strk.burn(accounts["Bob"], burn_amount_2)
-    
-    if success:
-        print("✅ Bob burn successful!")
-        print(f"   Burned: {strk.to_tokens(burn_amount_2):,.0f} STRK")
-    else:
-        print("❌ Bob burn failed!")
-    
-    print_balances(strk, accounts)
-    
-    # Charlie burns remaining tokens
-    charlie_balance = strk.balance_of(accounts["Charlie"])
-    if charlie_balance > 0:
-        print(f"\n🔥 Charlie burning all remaining tokens ({strk.to_tokens(charlie_balance):,.0f} STRK)...")
-        success = strk.burn(accounts["Charlie"], charlie_balance)
-        
-        if success:
-            print("✅ Charlie burn successful!")
-            print(f"   Burned: {strk.to_tokens(charlie_balance):,.0f} STRK")
-        else:
-            print("❌ Charlie burn failed!")
-    
-    print_balances(strk, accounts)
+    totals = run_script(strk, accounts, _SCRIPT)
     
     # === SUMMARY ===
     print("\n" + "="*20 + " SUMMARY " + "="*20)
-    total_minted = mint_amount_alice + mint_amount_bob
-    total_burned = burn_amount_1 + burn_amount_2 + charlie_balance
-    
     print(f"📊 Operation Summary:")
-    print(f"   Total Minted: {strk.to_tokens(total_minted):,.0f} STRK")
-    print(f"   Total Burned: {strk.to_tokens(total_burned):,.0f} STRK")
-    print(f"   Net Supply: {strk.to_tokens(strk.total_supply):,.0f} STRK")
-    print(f"   Transfers: 3 successful transfers")
+    print(f"   Total Minted: {strk.to_tokens_str(totals['mint'])} STRK")
+    print(f"   Total Burned: {strk.to_tokens_str(totals['burn'])} STRK")
+    print(f"   Net Supply: {strk.to_tokens_str(strk.total_supply)} STRK")
+    print(f"   Transfers: {totals['transfer']} successful transfers")
     
     # Show recent events
     print(f"\n📜 Recent Events:")
     events = strk.get_events()
     for event in events[-3:]:  # Last 3 events
         if event["type"] == "Transfer":
-            from_short = "0x000..." if event["from"] == "0x0000000000000000000000000000000000000000" else event["from"][:8] + "..."
-            to_short = "0x000..." if event["to"] == "0x0000000000000000000000000000000000000000" else event["to"][:8] + "..."
-            amount = strk.to_tokens(event["value"])
+            from_short = "0x000..." if event["from"] == ZERO_ADDRESS else event["from"][:8] + "..."
+            to_short = "0x000..." if event["to"] == ZERO_ADDRESS else event["to"][:8] + "..."
+            amount = strk.to_tokens_str(event["value"])
             
-            if event["from"] == "0x0000000000000000000000000000000000000000":
-                print(f"   🪙 MINT: {amount:,.0f} STRK → {to_short}")
-            elif event["to"] == "0x0000000000000000000000000000000000000000":
-                print(f"   🔥 BURN: {amount:,.0f} STRK from {from_short}")
+            if event["from"] == ZERO_ADDRESS:
+                print(f"   🪙 MINT: {amount} STRK → {to_short}")
+            elif event["to"] == ZERO_ADDRESS:
+                print(f"   🔥 BURN: {amount} STRK from {from_short}")
             else:
-                print(f"   💸 SEND: {amount:,.0f} STRK from {from_short} → {to_short}")
+                print(f"   💸 SEND: {amount} STRK from {from_short} → {to_short}")
     
     print(f"\n🎉 All operations completed successfully!")
     print("=" * 50)
@@ -0,0 +1,119 @@
+"""
+Batched transfer simulator for SEYToken load tests
+
+Replays large batches of (sender, recipient, amount) transfers against a
+flat int64 balances array instead of per-call Python dict updates.
+Addresses are interned to small integer indices outside the kernel, and
+the kernel itself is numba-jitted to a machine-code loop when numba is
+available, so replaying thousands of recorded transfers for analytics
+costs a fraction of driving the SEYToken methods directly.
+
+Usage: python scripts/simulate_transfers.py [num_transfers]
+"""
+
+import sys
+import time
+from typing import Dict, List, Tuple
+
+try:
+    import numpy as np
+except ImportError as exc:  # numpy is required; only numba is optional
+    raise SystemExit(
+        "simulate_transfers requires numpy: pip install numpy "
+        "(numba is an optional extra speedup)"
+    ) from exc
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is an optional speedup
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        if args and callable(args[0]):
+            return args[0]
+        return wrap
+
+
+@njit(cache=True)
+def _transfer_kernel(balances, src, dst, amt, ok):
+    """Apply transfers in order; ok[i] records whether transfer i landed."""
+    for i in range(src.shape[0]):
+        amount = amt[i]
+        if amount > 0 and balances[src[i]] >= amount:
+            balances[src[i]] -= amount
+            balances[dst[i]] += amount
+            ok[i] = True
+
+
+def intern_addresses(transfers: List[Tuple[str, str, int]]) -> Dict[str, int]:
+    """Map every address in the batch to a dense integer index."""
+    index: Dict[str, int] = {}
+    for sender, recipient, _ in transfers:
+        if sender not in index:
+            index[sender] = len(index)
+        if recipient not in index:
+            index[recipient] = len(index)
+    return index
+
+
+def simulate_transfers(
+    initial_balances: Dict[str, int],
+    transfers: List[Tuple[str, str, int]]
+) -> Tuple[Dict[str, int], np.ndarray]:
+    """
+    Replay a transfer batch and return (final balances, success flags).
+
+    Args:
+        initial_balances: address -> starting balance
+        transfers: ordered (sender, recipient, amount) tuples
+
+    Returns:
+        Tuple of the final address -> balance mapping and a bool array
+        marking which transfers succeeded.
+    """
+    index = intern_addresses(transfers)
+    for address in initial_balances:
+        if address not in index:
+            index[address] = len(index)
+
+    balances = np.zeros(len(index), dtype=np.int64)
+    for address, balance in initial_balances.items():
+        balances[index[address]] = balance
+
+    src = np.fromiter((index[s] for s, _, _ in transfers), dtype=np.int64, count=len(transfers))
+    dst = np.fromiter((index[r] for _, r, _ in transfers), dtype=np.int64, count=len(transfers))
+    amt = np.fromiter((a for _, _, a in transfers), dtype=np.int64, count=len(transfers))
+    ok = np.zeros(len(transfers), dtype=np.bool_)
+
+    _transfer_kernel(balances, src, dst, amt, ok)
+
+    return {address: int(balances[i]) for address, i in index.items()}, ok
+
+
+def main():
+    """Benchmark the simulator against a synthetic transfer batch."""
+    num_transfers = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    rng = np.random.default_rng(0)
+    addresses = [f"0x{i:040x}" for i in range(256)]
+    transfers = [
+        (addresses[s], addresses[r], int(a))
+        for s, r, a in zip(
+            rng.integers(0, len(addresses), num_transfers),
+            rng.integers(0, len(addresses), num_transfers),
+            rng.integers(1, 1000, num_transfers)
+        )
+    ]
+    initial = {addresses[0]: 10_000_000}
+
+    start = time.perf_counter()
+    balances, ok = simulate_transfers(initial, transfers)
+    elapsed = time.perf_counter() - start
+
+    print(f"Replayed {num_transfers} transfers in {elapsed:.3f}s")
+    print(f"   Succeeded: {int(ok.sum())}")
+    print(f"   Supply check: {sum(balances.values())} == {sum(initial.values())}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+"""
+Optional Cython build for the SEY and STRK token contracts.
+
+The contracts stay importable as plain Python; compiling them lets
+Cython use the existing int annotations on the hot transfer paths to
+skip boxed arithmetic and go through C-level dict operations.
+
+Usage: python setup.py build_ext --inplace
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="nii-contracts",
+    ext_modules=cythonize(
+        ["contracts/nii.py", "contracts/strk.py"],
+        language_level=3,
+        annotate=True
+    )
+)
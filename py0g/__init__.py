@@ -9,16 +9,35 @@ __version__ = "0.2.0"
 __author__ = "0G Python SDK Team"
 __description__ = "Python-first smart contract CLI for 0G Galileo blockchain"
 
-from .compiler import PythonContractCompiler
-from .hasher import ProgramHasher
-from .prover import ZKProver
-from .deployer import ContractDeployer
-from .verifier import ContractVerifier
+# Submodule for each exported class; resolved on first attribute access
+# (PEP 562) so importing py0g does not drag in web3 and friends before a
+# subcommand actually needs them
+_LAZY_IMPORTS = {
+    "PythonContractCompiler": "compiler",
+    "ProgramHasher": "hasher",
+    "ZKProver": "prover",
+    "ContractDeployer": "deployer",
+    "ContractVerifier": "verifier",
+}
 
 __all__ = [
     "PythonContractCompiler",
-    "ProgramHasher", 
+    "ProgramHasher",
     "ZKProver",
     "ContractDeployer",
     "ContractVerifier"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    value = getattr(importlib.import_module("." + module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -0,0 +1,50 @@
+"""
+Shared artifact serialization helpers.
+
+Every toolchain module writes its JSON artifacts through one helper so
+serialization speed and crash-safety improve in a single place.
+"""
+import json
+import os
+import tempfile
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
+
+def dump_json_atomic(path, obj) -> None:
+    """
+    Serialize obj as indented JSON and swap it into place atomically.
+
+    Uses orjson when available (C serializer, writes bytes directly)
+    and stdlib json otherwise. Writing to a temp file in the same
+    directory and os.replace()-ing it in means an interrupted write
+    never leaves a truncated artifact behind.
+
+    Args:
+        path: Destination file path
+        obj: JSON-serializable object
+    """
+    path = Path(path)
+    if orjson is not None:
+        try:
+            data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            data = json.dumps(obj, indent=2).encode("utf-8")
+    else:
+        data = json.dumps(obj, indent=2).encode("utf-8")
+
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            tmp_file.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
@@ -13,6 +13,8 @@ from pathlib import Path
 from dataclasses import dataclass
 from pydantic import BaseModel
 
+from .artifacts import dump_json_atomic
+
 
 class CompilerError(Exception):
     """Exception raised during contract compilation."""
@@ -139,10 +141,10 @@ class PythonContractCompiler:
         (self.output_dir / f"{name}.bin").write_bytes(bytecode)
         
         # Save ABI
-        (self.output_dir / f"{name}.abi.json").write_text(json.dumps(abi, indent=2))
+        dump_json_atomic(self.output_dir / f"{name}.abi.json", abi)
         
         # Save metadata
-        (self.output_dir / f"{name}.metadata.json").write_text(json.dumps(metadata, indent=2))
+        dump_json_atomic(self.output_dir / f"{name}.metadata.json", metadata)
     
     def save_artifacts(self, result: CompilationResult, contract_name: str, output_dir: str) -> Dict[str, str]:
         """
@@ -168,12 +170,12 @@ class PythonContractCompiler:
         
         # Save ABI
         abi_file = output_path / f"{contract_name}.abi.json"
-        abi_file.write_text(json.dumps(result.abi, indent=2))
+        dump_json_atomic(abi_file, result.abi)
         saved_files["abi"] = str(abi_file)
         
         # Save metadata
         metadata_file = output_path / f"{contract_name}.metadata.json"
-        metadata_file.write_text(json.dumps(result.metadata, indent=2))
+        dump_json_atomic(metadata_file, result.metadata)
         saved_files["metadata"] = str(metadata_file)
         
         return saved_files
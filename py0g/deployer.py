@@ -15,6 +15,8 @@ from web3 import Web3
 from eth_utils.address import to_checksum_address
 import requests
 
+from .artifacts import dump_json_atomic
+
 
 @dataclass
 class DeploymentResult:
@@ -349,6 +351,6 @@ class ContractDeployer:
         
         # Convert to dictionary and save
         deployment_data = asdict(deployment_result)
-        deployment_file.write_text(json.dumps(deployment_data, indent=2))
+        dump_json_atomic(deployment_file, deployment_data)
         
         return str(deployment_file)
\ No newline at end of file
@@ -6,12 +6,20 @@ reproducible results and contract verification capabilities.
 """
 
 import hashlib
+
+# Resolved once: hashlib's generic constructor routes to the OpenSSL
+# backend (which uses hardware SHA/SIMD where the platform has it) and
+# falls back to the builtin _sha3 module otherwise. Binding it here also
+# skips the module attribute lookup on every digest.
+_sha3_256 = hashlib.sha3_256
 import json
 from typing import Dict, Any, Optional
 from pathlib import Path
 from dataclasses import dataclass
 from datetime import datetime
 
+from .artifacts import dump_json_atomic
+
 
 class HashError(Exception):
     """Exception raised during hash generation."""
@@ -33,9 +41,12 @@ class ProgramHasher:
     Ensures reproducible hashes for contract verification and integrity checking.
     """
     
-    def __init__(self, output_dir: str = "artifacts"):
+    def __init__(self, output_dir: str = "artifacts", digest_factory=None):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
+        # Injection point for an accelerated SHA3-256 (any hashlib-style
+        # constructor); defaults to the fastest stdlib backend
+        self._digest = digest_factory or _sha3_256
         
     def generate_program_hash(self, source_file: str, bytecode: Optional[bytes] = None) -> HashResult:
         """
@@ -118,11 +129,11 @@ class ProgramHasher:
         """Generate SHA3-256 hash of source code."""
         # Normalize source code (remove extra whitespace, etc.)
         normalized = self._normalize_source(source_code)
-        return hashlib.sha3_256(normalized.encode('utf-8')).hexdigest()
+        return self._digest(normalized.encode('utf-8')).hexdigest()
     
     def _hash_program(self, source_code: str, bytecode: bytes) -> str:
         """Generate deterministic program hash from source and bytecode."""
-        hasher = hashlib.sha3_256()
+        hasher = self._digest()
         
         # Hash source code first
         normalized_source = self._normalize_source(source_code)
@@ -156,7 +167,7 @@ class ProgramHasher:
         }
         
         hash_file = self.output_dir / f"{name}.hash.json"
-        hash_file.write_text(json.dumps(hash_data, indent=2))
+        dump_json_atomic(hash_file, hash_data)
     
     def load_hash_metadata(self, contract_name: str) -> Optional[Dict[str, Any]]:
         """Load previously saved hash metadata."""
@@ -203,7 +214,7 @@ class ProgramHasher:
         }
         
         hash_file = output_path / f"{contract_name}_hash.json"
-        hash_file.write_text(json.dumps(hash_data, indent=2))
+        dump_json_atomic(hash_file, hash_data)
         
         return str(hash_file)
     
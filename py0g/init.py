@@ -333,7 +333,11 @@ class {{CONTRACT_NAME}}:
             owner: Address of the contract owner
         """
         self.owner: str = owner
-        self.data: Dict[str, Any] = {}
+        # Storage is sharded by value type: hot integer values get their
+        # own type-stable dict (which the adaptive interpreter can
+        # specialize), everything else falls back to a generic dict.
+        self._int_data: Dict[str, int] = {}
+        self._obj_data: Dict[str, Any] = {}
         self.counter: int = 0
     
     def set_data(self, key: str, value: Any) -> bool:
@@ -347,7 +351,12 @@ class {{CONTRACT_NAME}}:
         Returns:
             bool: True if successful
         """
-        self.data[key] = value
+        if type(value) is int:
+            self._int_data[key] = value
+            self._obj_data.pop(key, None)
+        else:
+            self._obj_data[key] = value
+            self._int_data.pop(key, None)
         return True
     
     def get_data(self, key: str) -> Any:
@@ -360,7 +369,11 @@ class {{CONTRACT_NAME}}:
         Returns:
             Any: The stored value or None if not found
         """
-        return self.data.get(key)
+        # Integers are the common case, so probe the int shard first
+        value = self._int_data.get(key)
+        if value is None:
+            value = self._obj_data.get(key)
+        return value
     
     def increment_counter(self) -> int:
         """
@@ -413,7 +426,7 @@ class Test{{CONTRACT_NAME}}:
         """Test contract initialization."""
         assert self.contract.get_owner() == self.owner
         assert self.contract.get_counter() == 0
-        assert len(self.contract.data) == 0
+        assert self.contract.get_data("anything") is None
     
     def test_set_and_get_data(self):
         """Test data storage and retrieval."""
@@ -428,6 +441,10 @@ class Test{{CONTRACT_NAME}}:
         # Test non-existent key
         value = self.contract.get_data("nonexistent")
         assert value is None
+        
+        # Integer values take the specialized storage path
+        assert self.contract.set_data("int_key", 42) is True
+        assert self.contract.get_data("int_key") == 42
     
     def test_counter_operations(self):
         """Test counter functionality."""
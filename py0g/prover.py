@@ -12,6 +12,8 @@ from pathlib import Path
 from dataclasses import dataclass
 from datetime import datetime
 
+from .artifacts import dump_json_atomic
+
 
 class ProofError(Exception):
     """Exception raised during proof generation."""
@@ -228,19 +230,19 @@ class ZKProver:
         """Save proof artifacts to disk."""
         # Save proof
         proof_file = self.output_dir / f"{name}.proof.json"
-        proof_file.write_text(json.dumps(proof, indent=2))
+        dump_json_atomic(proof_file, proof)
         
         # Save public inputs
         inputs_file = self.output_dir / f"{name}.inputs.json"
-        inputs_file.write_text(json.dumps(public_inputs, indent=2))
+        dump_json_atomic(inputs_file, public_inputs)
         
         # Save verification key
         vk_file = self.output_dir / f"{name}.vk.json"
-        vk_file.write_text(json.dumps(verification_key, indent=2))
+        dump_json_atomic(vk_file, verification_key)
         
         # Save metadata
         metadata_file = self.output_dir / f"{name}.proof.metadata.json"
-        metadata_file.write_text(json.dumps(metadata, indent=2))
+        dump_json_atomic(metadata_file, metadata)
     
     def load_proof_artifacts(self, contract_name: str) -> Optional[Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]]:
         """Load proof artifacts from disk."""
@@ -300,7 +302,7 @@ class ZKProver:
         }
         
         proof_file = output_path / f"{contract_name}_proof.json"
-        proof_file.write_text(json.dumps(proof_data, indent=2))
+        dump_json_atomic(proof_file, proof_data)
         
         return str(proof_file)
 